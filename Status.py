@@ -1,25 +1,33 @@
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, CallbackQueryHandler, ContextTypes
 from telegram.constants import ParseMode
 from telegram import ChatInviteLink, InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram.error import NetworkError, RetryAfter
 from contextlib import asynccontextmanager
 from google.oauth2.service_account import Credentials
 from starlette.requests import ClientDisconnect
 from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
 from dotenv import load_dotenv
 from http import HTTPStatus
-import pandas as pd
-import tempfile
 import calendar
 import gspread
+import requests
 import base64
 import json
 import re
 import os
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 import asyncio
+import contextvars
+import functools
+import random
+import sqlite3
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Load environment variables from .env
 load_dotenv()
@@ -29,42 +37,67 @@ load_dotenv()
 TELEGRAM_TOKEN = os.getenv('Telegram_Token')
 CHAT_ID = os.getenv('Chat_ID')
 GROUP_CHAT_ID = os.getenv('Group_Chat_ID')
-chat_id = GROUP_CHAT_ID # Default
+current_chat_id = contextvars.ContextVar("current_chat_id", default=GROUP_CHAT_ID) # Chat of the update being handled, scheduled jobs use the group chat
 # print("Telegram Token: ", os.getenv('Telegram_Token'))
 if not TELEGRAM_TOKEN:
     raise ValueError("Telegram Token is missing from the environment variables!")
 
 KNOWN_RANKS = ["REC", "PTE", "LCP", "CPL", "CFC", "3SG", "2SG", "1SG", "SSG", "MSG", "ME1T", "ME1","ME2","ME3","ME4","ME5","ME6","ME7","ME8", "WO", "SWO", "MWO", "OCT", "LTA", "CPT", "MAJ", "LTC", "COL"]
 
-# Step 1: Decode the base64 credentials
-print(f"Env Variable Found: {os.getenv('Google_Sheets_Credentials') is not None}")
-credentials_data = os.getenv('Google_Sheets_Credentials')
-if credentials_data:
-    credentials_json = base64.b64decode(credentials_data)
+# Step 1: Decode the base64 credentials (In memory, nothing is written to disk)
+SHEETS_SCOPE = ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
 
-    # Create a temporary file to store the credentials
-    with tempfile.NamedTemporaryFile(delete=False, mode='wb') as temp_file:
-        temp_file.write(credentials_json)
-        temp_file_path = temp_file.name
+def authorize_sheets():
+    print(f"Env Variable Found: {os.getenv('Google_Sheets_Credentials') is not None}")
+    credentials_data = os.getenv('Google_Sheets_Credentials')
+    if not credentials_data:
+        raise ValueError("Google Sheets credentials not found in environment variables.")
+    credentials_info = json.loads(base64.b64decode(credentials_data))
 
     # Step 2: Authenticate & Connect to Google Sheets
-    scope = ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
-    credentials = Credentials.from_service_account_file(temp_file_path, scopes=scope)
-    client = gspread.authorize(credentials)
-    
-    # Clean up temporary file (optional)
-    os.remove(temp_file_path)
-else:
-    print("❌ Error: Google Sheets credentials not found in environment variables.")
+    credentials = Credentials.from_service_account_info(credentials_info, scopes=SHEETS_SCOPE)
+    return gspread.authorize(credentials)
 
 # Step 3: Open Google Sheet (Change all (ai_ / real_) to toggle)
 real_google_sheets_url = os.getenv("real_google_sheets_url")
-sheet = client.open_by_url(real_google_sheets_url)
 real_informal_google_sheets_url = os.getenv("real_informal_google_sheets_url")
-informal_sheet = client.open_by_url(real_informal_google_sheets_url) 
 data_google_sheets_url = os.getenv("data_google_sheets_url")
-data_sheet = client.open_by_url(data_google_sheets_url)
-print("✅ Successfully connected to Google Sheets!")
+sheet, informal_sheet, data_sheet = None, None, None # Opened in the background on startup, see connect_sheets
+sheets_connected = asyncio.Event()
+SHEETS_CONNECT_TIMEOUT = float(os.getenv("Sheets_Connect_Timeout", "60")) # Seconds a flow waits for the spreadsheets
+startup_state = {"sheets": "connecting", "webhook": "pending", "error": None}
+
+async def connect_sheets():
+    global sheet, informal_sheet, data_sheet
+    attempt = 0
+    while True:
+        try:
+            client = authorize_sheets()
+            urls = [real_google_sheets_url, real_informal_google_sheets_url, data_google_sheets_url]
+            # All three spreadsheets are opened at the same time
+            sheet, informal_sheet, data_sheet = await asyncio.gather(*(run_sheets(sheets_call, "read", client.open_by_url, url) for url in urls))
+            break
+        except ValueError as e: # Missing or broken credentials, retrying won't help
+            startup_state["sheets"], startup_state["error"] = "failed", str(e)
+            print(f"❌ Error: {e}")
+            return
+        except Exception as e:
+            startup_state["error"] = str(e)
+            delay = min(2 ** attempt, 60)
+            attempt += 1
+            print(f"⚠️ Error connecting to Google Sheets, retrying in {delay}s: {e}")
+            await asyncio.sleep(delay)
+    startup_state["sheets"], startup_state["error"] = "ready", None
+    sheets_connected.set()
+    print("✅ Successfully connected to Google Sheets!")
+
+async def wait_for_sheets():
+    if not sheets_connected.is_set():
+        print("⌛ Waiting for Google Sheets connection...")
+        try:
+            await asyncio.wait_for(sheets_connected.wait(), timeout=SHEETS_CONNECT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"Google Sheets not connected ({startup_state['sheets']}): {startup_state['error']}")
 
 # Step 4: Building the bot
 ptb = (
@@ -76,6 +109,104 @@ ptb = (
     .build()
 )
 
+# Metrics (Served on /metrics in the Prometheus text format)
+METRIC_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60) # Seconds
+
+def format_labels(names, values):
+    return ",".join('{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for name, value in zip(names, values))
+
+class Counter:
+    # Thread-safe, label values are passed in the order of the label names
+    def __init__(self, name, help_text, labels=()):
+        self.name, self.help, self.labels = name, help_text, labels
+        self.series = {} # Label values -> total
+        self.lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self.lock:
+            self.series[label_values] = self.series.get(label_values, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self.lock:
+            for label_values, total in sorted(self.series.items()):
+                lines.append(f"{self.name}{{{format_labels(self.labels, label_values)}}} {total}")
+        return lines
+
+class Histogram:
+    def __init__(self, name, help_text, labels=(), buckets=METRIC_BUCKETS):
+        self.name, self.help, self.labels, self.buckets = name, help_text, labels, buckets
+        self.series = {} # Label values -> [count per bucket..., sum, count]
+        self.lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self.lock:
+            series = self.series.setdefault(label_values, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            for label_values, series in sorted(self.series.items()):
+                labels = format_labels(self.labels, label_values)
+                prefix = f"{labels}," if labels else ""
+                for bound, count in zip(self.buckets, series):
+                    lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {count}')
+                lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {series[-1]}')
+                lines.append(f"{self.name}_sum{{{labels}}} {series[-2]}")
+                lines.append(f"{self.name}_count{{{labels}}} {series[-1]}")
+        return lines
+
+duration_seconds = Histogram("status_bot_duration_seconds", "Time spent in handlers, jobs and parsing steps.", ("name",))
+sheets_target_requests = Counter("status_bot_sheets_target_requests_total", "Google Sheets requests per worksheet, batch requests count once for each worksheet they touch.", ("kind", "target"))
+sheets_skipped_cells = Counter("status_bot_sheets_skipped_cells_total", "Planned cell writes dropped because the cell already held the value.", ("worksheet",))
+sheets_downloaded_bytes = Counter("status_bot_sheets_downloaded_bytes_total", "Characters of cell values downloaded per worksheet.", ("worksheet",))
+
+def timed(name):
+    # Records how long a function takes in duration_seconds
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    duration_seconds.observe(time.perf_counter() - start, name)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    duration_seconds.observe(time.perf_counter() - start, name)
+        return wrapper
+    return decorator
+
+# Name of the handler or job making Sheets requests (For request accounting)
+current_flow = contextvars.ContextVar("current_flow", default="other")
+
+def track_flow(name):
+    # Labels the Sheets requests made by a handler or job and times it (Which waits for the spreadsheets to be opened first)
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            token = current_flow.set(name)
+            start = time.perf_counter()
+            try:
+                await wait_for_sheets()
+                return await func(*args, **kwargs)
+            finally:
+                current_flow.reset(token)
+                duration_seconds.observe(time.perf_counter() - start, name)
+        return wrapper
+    return decorator
+
 # Send message when bot starts (Both chats)
 async def send_startup_message():
     # Replace with the chat ID where you want to send the message
@@ -83,8 +214,6 @@ async def send_startup_message():
     group_chat_id = GROUP_CHAT_ID
     await ptb.bot.send_message(chat_id, "Startup complete!")
     # await ptb.bot.send_message(group_chat_id, "Startup complete!")
-    asyncio.create_task(start_scheduler())
-    print("✅ Scheduler started")
 
 # /Start command handler
 async def start(update: Update, _: ContextTypes.DEFAULT_TYPE):
@@ -125,13 +254,13 @@ ptb.add_handler(CommandHandler("id", get_chat_id))
 # /check Manually run status check
 async def check_status(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # telegram_message = await ptb.bot.send_message(chat_id=CHAT_ID, text="🔄 Checking status...")
-    telegram_message = await ptb.bot.send_message(chat_id=chat_id, text="🔄 Checking status...")
+    telegram_message = await ptb.bot.send_message(chat_id=current_chat_id.get(), text="🔄 Checking status...")
     message = await check_and_update_status()
     await telegram_message.edit_text(message)
 
     await asyncio.sleep(2) # Just a pause
 
-    telegram_message = await ptb.bot.send_message(chat_id=chat_id, text="🔄 Checking informal status...")
+    telegram_message = await ptb.bot.send_message(chat_id=current_chat_id.get(), text="🔄 Checking informal status...")
     message = await check_and_update_informal_status()
     await telegram_message.edit_text(message)
 ptb.add_handler(CommandHandler("check", check_status))
@@ -154,7 +283,7 @@ async def command_list(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 /delete - ❌ Removes the latest status from the history sheet.'''
 
-    await ptb.bot.send_message(chat_id=chat_id, text=text)
+    await ptb.bot.send_message(chat_id=current_chat_id.get(), text=text)
 ptb.add_handler(CommandHandler("help", command_list))
 
 # /eg Format explanation
@@ -223,7 +352,7 @@ With or without the "." and ":", of course.
 I can't think of anything else that needs explaining. Let me know if there are any more details that you wish to know!
 '''
 
-    await ptb.bot.send_message(chat_id=chat_id, text=text)
+    await ptb.bot.send_message(chat_id=current_chat_id.get(), text=text)
 ptb.add_handler(CommandHandler("eg", eg))
 
 # /git Git collaboration explanation
@@ -263,35 +392,140 @@ After pushing changes, go to Pull Requests in the repo.
 Click "New Pull Request", compare changes, and submit.
 
 I'll have to review and merge them...'''
-    await ptb.bot.send_message(chat_id=chat_id, text=text)
+    await ptb.bot.send_message(chat_id=current_chat_id.get(), text=text)
 ptb.add_handler(CommandHandler("git", git))
 
 # /delete Delete latest status sent in history
+@track_flow("delete")
 async def delete(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    datasheet = data_sheet.worksheet("Status")
-    datasheet.delete_rows(2)
-    await ptb.bot.send_message(chat_id=chat_id, text="✅ Successfully removed latest update in history.")
+    status_journal = await get_journal()
+    removed = status_journal.remove_latest()
+    if not removed:
+        await ptb.bot.send_message(chat_id=current_chat_id.get(), text="⚠️ History is already empty.")
+        return
+    schedule_history_mirror()
+    await ptb.bot.send_message(chat_id=current_chat_id.get(), text=f"✅ Successfully removed latest update in history. ({removed[1]})")
 ptb.add_handler(CommandHandler("delete", delete))
 
 # Function for other functions to send Telegram message
+MAX_MESSAGE_LENGTH = 4096 # Telegram limit per message
+TELEGRAM_MERGE_WINDOW = float(os.getenv("Telegram_Merge_Window", "1.5")) # Seconds to wait for more messages to the same chat
+TELEGRAM_MESSAGES_PER_MINUTE = int(os.getenv("Telegram_Messages_Per_Minute", "20")) # Group chat limit
+TELEGRAM_MAX_RETRIES = int(os.getenv("Telegram_Max_Retries", "5"))
+outbox = {} # Chat id -> {"texts": queued messages, "task": sender task, "bucket": per-chat rate limit}
+telegram_stats = {"queued": 0, "sent": 0, "retries": 0, "failed": 0}
+
 async def send_telegram_message(message: str, chat_id: int):
-    await ptb.bot.send_message(chat_id=chat_id, text=message)
+    # Queued and merged with other messages to the same chat, returns without waiting for Telegram
+    if not message or not message.strip():
+        return
+    box = outbox.setdefault(chat_id, {"texts": [], "task": None, "bucket": TokenBucket(TELEGRAM_MESSAGES_PER_MINUTE)})
+    box["texts"].append(message.rstrip())
+    telegram_stats["queued"] += 1
+    if box["task"] is None or box["task"].done():
+        box["task"] = asyncio.create_task(deliver_messages(chat_id))
+
+async def deliver_messages(chat_id):
+    box = outbox[chat_id]
+    while box["texts"]:
+        await asyncio.sleep(TELEGRAM_MERGE_WINDOW) # Let the rest of a burst join
+        texts, box["texts"] = box["texts"], []
+        for chunk in split_message("\n\n".join(texts)):
+            await deliver_message(chat_id, chunk, box["bucket"])
+
+def split_message(text, limit=MAX_MESSAGE_LENGTH):
+    # Split on line breaks, lines longer than the limit are cut
+    chunks, current = [], ""
+    for line in text.split("\n"):
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        if current and len(current) + 1 + len(line) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current.strip():
+        chunks.append(current)
+    return chunks
+
+async def deliver_message(chat_id, text, bucket):
+    for attempt in range(TELEGRAM_MAX_RETRIES + 1):
+        delay = bucket.reserve()
+        while delay:
+            await asyncio.sleep(delay)
+            delay = bucket.reserve()
+        try:
+            await ptb.bot.send_message(chat_id=chat_id, text=text)
+            telegram_stats["sent"] += 1
+            return True
+        except RetryAfter as e:
+            # Flood control, hold every message to this chat for as long as Telegram asks
+            retry_after = e.retry_after.total_seconds() if isinstance(e.retry_after, timedelta) else e.retry_after
+            bucket.pause(retry_after)
+            print(f"⌛ Telegram asked to wait {retry_after}s before sending to {chat_id}.")
+        except NetworkError as e:
+            await asyncio.sleep(min(2 ** attempt, 30))
+            print(f"⚠️ Telegram send to {chat_id} failed (Attempt {attempt + 1}): {e}")
+        except Exception as e:
+            print(f"⚠️ Telegram send to {chat_id} failed: {e}")
+            break
+        telegram_stats["retries"] += 1
+    telegram_stats["failed"] += 1
+    print(f"⚠️ Dropped Telegram message to {chat_id}: {text[:100]}")
+    return False
+
+async def flush_telegram_messages(timeout=10):
+    # Wait for queued messages, used on shutdown
+    tasks = [box["task"] for box in outbox.values() if box["task"] and not box["task"].done()]
+    if tasks:
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=timeout)
+        except asyncio.TimeoutError:
+            print(f"⚠️ {sum(len(box['texts']) for box in outbox.values())} Telegram messages not sent before shutdown.")
 
-@asynccontextmanager
-async def lifespan(_: FastAPI):
-    await ptb.bot.deleteWebhook()  # Ensure webhook is reset
-    await asyncio.sleep(1)  # Small delay to ensure completion
-    await ptb.bot.setWebhook("https://telegramstatusupdate.onrender.com/webhook") # replace <your-webhook-url>
-    # Railway: https://updatestatus-production.up.railway.app/webhook
+async def register_webhook():
+    try:
+        await ptb.bot.deleteWebhook()  # Ensure webhook is reset
+        await asyncio.sleep(1)  # Small delay to ensure completion
+        await ptb.bot.setWebhook("https://telegramstatusupdate.onrender.com/webhook") # replace <your-webhook-url>
+        # Railway: https://updatestatus-production.up.railway.app/webhook
+        startup_state["webhook"] = "ready"
 
-    # Debugging
-    # webhook_info = await ptb.bot.getWebhookInfo()
-    # print(f"✅ Webhook set to: {webhook_info.url}")
+        # Debugging
+        # webhook_info = await ptb.bot.getWebhookInfo()
+        # print(f"✅ Webhook set to: {webhook_info.url}")
 
-    async with ptb:
         await send_startup_message()
+    except Exception as e:
+        startup_state["webhook"] = "failed"
+        print(f"⚠️ Error setting up webhook: {e}")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Spreadsheets are opened and the webhook is set in the background, the server can answer /ping straight away
+    sheets_task = asyncio.create_task(connect_sheets())
+    async with ptb:
         await ptb.start()
+        start_scheduler()
+        print("✅ Scheduler started")
+        workers = [asyncio.create_task(update_worker(i)) for i in range(WEBHOOK_WORKERS)]
+        print(f"✅ Started {WEBHOOK_WORKERS} update workers")
+        webhook_task = asyncio.create_task(register_webhook())
         yield
+        # Let queued updates finish before shutting down
+        try:
+            await asyncio.wait_for(update_queue.join(), timeout=10)
+        except asyncio.TimeoutError:
+            print(f"⚠️ {queued_updates()} queued updates not processed before shutdown.")
+        for task in [*workers, sheets_task, webhook_task]:
+            task.cancel()
+        scheduler.shutdown(wait=False)
+        await flush_history_mirror()
+        await flush_telegram_messages()
         await ptb.stop()
 
 app = FastAPI(lifespan=lifespan)
@@ -302,6 +536,13 @@ async def ping(request: Request):
     print(f"Received {request.method} request from {request.client.host}")
     return {"message": "pong"}
 
+@app.get("/ready")
+@app.head("/ready")
+async def ready():
+    # 200 once Google Sheets is connected, 503 while starting up
+    status_code = HTTPStatus.OK if sheets_connected.is_set() else HTTPStatus.SERVICE_UNAVAILABLE
+    return JSONResponse(startup_state, status_code=status_code)
+
 @app.post("/webhook")
 async def process_update(request: Request):
     try:
@@ -317,18 +558,162 @@ async def process_update(request: Request):
     
     update = Update.de_json(req, ptb.bot)
 
-    global chat_id # Declare global variable
-    # Validate if update.message exists
-    if update.message is not None:
-        chat_id = update.message.chat.id
-        print(f"🔔 Chat ID updated: {chat_id}")
-    else:
-        print("⏭️ Update does not contain a message. Skipping chat_id update.")
-
-    await ptb.process_update(update)
+    # Queue the update and answer Telegram straight away, slow Sheets calls no longer hold the request open
+    webhook_stats["received"] += 1
+    try:
+        if queued_updates() >= WEBHOOK_QUEUE_SIZE: # Updates parked behind a busy chat count too
+            raise asyncio.QueueFull
+        update_queue.put_nowait(update)
+    except asyncio.QueueFull:
+        # Telegram retries non-2xx responses later, so the update is not lost
+        webhook_stats["rejected"] += 1
+        print(f"⚠️ Update queue full ({queued_updates()}/{WEBHOOK_QUEUE_SIZE}), asking Telegram to retry.")
+        return Response(status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+    webhook_stats["max_depth"] = max(webhook_stats["max_depth"], queued_updates())
     return Response(status_code=HTTPStatus.OK)
 
-# Message handler for processing status updates
+@app.get("/sheets/stats")
+async def sheets_request_stats():
+    with sheets_stats_lock:
+        return {counter: (dict(value) if isinstance(value, dict) else value) for counter, value in sheets_stats.items()}
+
+@app.get("/telegram/stats")
+async def telegram_send_stats():
+    return {**telegram_stats, "waiting": sum(len(box["texts"]) for box in outbox.values())}
+
+@app.get("/metrics")
+async def metrics():
+    return PlainTextResponse("\n".join(render_metrics()) + "\n", media_type="text/plain; version=0.0.4")
+
+def render_metrics():
+    lines = duration_seconds.render() + sheets_target_requests.render() + sheets_downloaded_bytes.render() + sheets_skipped_cells.render()
+
+    # Sheets request accounting, keyed "flow:kind"
+    with sheets_stats_lock:
+        for counter in ["requests", "retries", "failures"]:
+            name = f"status_bot_sheets_{counter}_total"
+            lines += [f"# HELP {name} Google Sheets {counter} per flow.", f"# TYPE {name} counter"]
+            for key, total in sorted(sheets_stats[counter].items()):
+                flow, _, kind = key.rpartition(":")
+                lines.append(f"{name}{{{format_labels(('flow', 'kind'), (flow, kind))}}} {total}")
+        lines += ["# HELP status_bot_sheets_throttled_seconds_total Time spent waiting for Sheets quota.", "# TYPE status_bot_sheets_throttled_seconds_total counter", f"status_bot_sheets_throttled_seconds_total {sheets_stats['throttled_seconds']}"]
+
+    for counter, total in telegram_stats.items():
+        name = f"status_bot_telegram_{counter}_total"
+        lines += [f"# HELP {name} Telegram messages {counter}.", f"# TYPE {name} counter", f"{name} {total}"]
+    for counter in ["received", "processed", "failed", "rejected"]:
+        name = f"status_bot_webhook_updates_{counter}_total"
+        lines += [f"# HELP {name} Webhook updates {counter}.", f"# TYPE {name} counter", f"{name} {webhook_stats[counter]}"]
+
+    gauges = {
+        "status_bot_webhook_queue_depth": (queued_updates(), "Updates waiting for a worker or for their chat."),
+        "status_bot_webhook_queue_max_depth": (webhook_stats["max_depth"], "Deepest the update queue has been."),
+        "status_bot_telegram_waiting_messages": (sum(len(box["texts"]) for box in outbox.values()), "Messages waiting to be merged and sent."),
+        "status_bot_pending_confirmations": (len(pending_updates), "Status updates waiting for a button press."),
+        "status_bot_sheets_ready": (int(sheets_connected.is_set()), "1 once Google Sheets is connected."),
+    }
+    for name, (value, help_text) in gauges.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"]
+    return lines
+
+@app.get("/webhook/stats")
+async def webhook_queue_stats():
+    return {**webhook_stats, "depth": queued_updates(), "busy_chats": len(chat_backlogs), "capacity": WEBHOOK_QUEUE_SIZE, "workers": WEBHOOK_WORKERS}
+
+# Webhook update queue (Drained by a pool of workers)
+WEBHOOK_QUEUE_SIZE = int(os.getenv("Webhook_Queue_Size", "100"))
+WEBHOOK_WORKERS = int(os.getenv("Webhook_Workers", "4"))
+update_queue = asyncio.Queue(maxsize=WEBHOOK_QUEUE_SIZE)
+webhook_stats = {"received": 0, "processed": 0, "failed": 0, "rejected": 0, "max_depth": 0}
+chat_backlogs = {} # Chat id -> updates waiting behind the one being processed, a chat is here while a worker has it
+
+def queued_updates():
+    return update_queue.qsize() + sum(len(backlog) for backlog in chat_backlogs.values())
+
+async def update_worker(worker_id):
+    while True:
+        update = await update_queue.get()
+        chat = update.effective_chat
+        key = chat.id if chat else None
+        if key in chat_backlogs:
+            # Another worker has this chat and takes the update next, keeps one busy chat from holding every worker
+            chat_backlogs[key].append(update)
+            continue
+        chat_backlogs[key] = deque()
+        try:
+            # Updates from one chat run in order on this worker
+            while update is not None:
+                await handle_update(worker_id, update)
+                update = chat_backlogs[key].popleft() if chat_backlogs[key] else None
+        finally:
+            del chat_backlogs[key]
+
+async def handle_update(worker_id, update):
+    # Replies go to this update's chat, other workers are handling other chats at the same time
+    chat = update.effective_chat
+    token = current_chat_id.set(chat.id if chat else GROUP_CHAT_ID)
+    try:
+        if chat is not None:
+            print(f"🔔 Handling update from chat: {chat.id}")
+        else:
+            print("⏭️ Update does not belong to a chat, replies go to the group chat.")
+
+        await ptb.process_update(update)
+        webhook_stats["processed"] += 1
+    except Exception as e:
+        webhook_stats["failed"] += 1
+        print(f"⚠️ Worker {worker_id} failed to process update {update.update_id}: {e}")
+    finally:
+        current_chat_id.reset(token)
+        update_queue.task_done() # Backlogged updates are only done once processed, so shutdown waits for them
+
+# Status updates waiting for a button press (Keyed by an id carried in the callback data)
+PENDING_LIMIT = int(os.getenv("Pending_Limit", "500"))
+PENDING_TTL = float(os.getenv("Pending_TTL", "900")) # Seconds before an unconfirmed status is dropped
+
+class PendingStore:
+    __slots__ = ("entries", "limit", "ttl", "counter")
+
+    def __init__(self, limit, ttl):
+        self.entries = OrderedDict() # Id -> (expires at, sender, status blocks), oldest first
+        self.limit = limit
+        self.ttl = ttl
+        self.counter = 0
+
+    def add(self, sender, blocks):
+        self.expire()
+        while len(self.entries) >= self.limit: # Full, drop the oldest
+            self.entries.popitem(last=False)
+        self.counter += 1
+        pending_id = f"{self.counter:x}{random.getrandbits(16):04x}" # Unique and hard to guess, fits in the 64 byte callback data
+        self.entries[pending_id] = (time.monotonic() + self.ttl, sender, blocks)
+        return pending_id
+
+    def pop(self, pending_id, sender):
+        # Returns the blocks, None if missing or expired, False if someone else sent them
+        entry = self.entries.get(pending_id)
+        if entry is None:
+            return None
+        if entry[1] != sender:
+            return False
+        del self.entries[pending_id]
+        return entry[2] if entry[0] > time.monotonic() else None
+
+    def expire(self):
+        # Same ttl for all, so expired entries are always at the front
+        now = time.monotonic()
+        while self.entries:
+            pending_id, entry = next(iter(self.entries.items()))
+            if entry[0] > now:
+                break
+            del self.entries[pending_id]
+
+    def __len__(self):
+        return len(self.entries)
+
+pending_updates = PendingStore(PENDING_LIMIT, PENDING_TTL)
+
+@timed("handle_message")
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     message = update.message.text.strip()
     sender = update.message.from_user.id
@@ -336,79 +721,121 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if len(message) < 5 or message[0:6].lower() != "status":
         print("⏭️ Message received is not a status message, skipping...")
         return None
-    print(f"📩 From Chat: {chat_id} | User {sender}: \n{message}") # Debugging
+    print(f"📩 From Chat: {current_chat_id.get()} | User {sender}: \n{message}") # Debugging
 
-    # Process the message and extract details
-    data = extract_message(message)
-    status, informal_status, location, names, all_flag, date_text, reason, sheets_to_update, informal_sheets_to_update = data["status"], data["informal_status"], data["location"], data["names"], data["all_flag"], data["date_text"], data["reason"], data["sheets_to_update"], data["informal_sheets_to_update"]
+    # Process the message and extract details (One status block per "Status:" line)
+    blocks = [extract_message(block) for block in split_status_blocks(message)]
 
-    # Confirmation button
+    # Confirmation button (Each message gets its own id, so several can wait at once)
+    pending_id = pending_updates.add(sender, blocks)
     keyboard = [
         [
-            InlineKeyboardButton("✅ Confirm", callback_data="confirm"),
-            InlineKeyboardButton("❌ Cancel", callback_data="cancel")
+            InlineKeyboardButton("✅ Confirm", callback_data=f"confirm:{pending_id}"),
+            InlineKeyboardButton("❌ Cancel", callback_data=f"cancel:{pending_id}")
         ]
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
-    
-    response = (
-        f"✅ *Status Update Received*\n"
-        f"📌 *Status:* {status}\n"
-        f"🎭 *Informal Status:* {informal_status}\n"
-        f"📍 *Location:* {location}\n"
-        f"👥 *Names:* {', '.join(names) if names else 'None'}\n"
-        f"📅 *Dates:* {date_text}\n"
-        f"📝 *Reason:* {reason}\n"
-        f"📄 *Sheets to Update:* {', '.join(sheets_to_update)}\n"
-        f"📋 *Informal Sheets:* {', '.join(informal_sheets_to_update)}"
-    )
 
-    await update.message.reply_text(response, reply_markup=reply_markup, parse_mode="Markdown"), 
+    if len(blocks) == 1:
+        data = blocks[0]
+        response = (
+            f"✅ *Status Update Received*\n"
+            f"📌 *Status:* {data.status}\n"
+            f"🎭 *Informal Status:* {data.informal_status}\n"
+            f"📍 *Location:* {data.location}\n"
+            f"👥 *Names:* {', '.join(data.names) if data.names else 'None'}\n"
+            f"📅 *Dates:* {data.date_text}\n"
+            f"📝 *Reason:* {data.reason}\n"
+            f"📄 *Sheets to Update:* {', '.join(data.sheets_to_update)}\n"
+            f"📋 *Informal Sheets:* {', '.join(data.informal_sheets_to_update)}"
+        )
+    else:
+        # Bulk message, one short summary per block
+        response = f"✅ *{len(blocks)} Status Updates Received*\n"
+        for i, data in enumerate(blocks, start=1):
+            location = f" @ {data.location}" if data.location else ""
+            response += (
+                f"\n*{i}. {data.status}{location}* ({data.informal_status})\n"
+                f"👥 {', '.join(data.names) if data.names else 'None'}\n"
+                f"📅 {data.date_text} | 📄 {', '.join(data.sheets_to_update)}\n"
+            )
+        if len(response) > MAX_MESSAGE_LENGTH:
+            response = response[:MAX_MESSAGE_LENGTH - 20].rsplit("\n\n", 1)[0] + "\n\n…(truncated)"
 
-    # Wait for user to confirm update
-    context.user_data["status_data"] = (status, informal_status, location, names, all_flag, date_text, reason, sheets_to_update, informal_sheets_to_update)
+    await update.message.reply_text(response, reply_markup=reply_markup, parse_mode="Markdown"), 
 ptb.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))  # Handles all text messages
 
+@track_flow("confirmation")
 async def handle_confirmation(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     data =  query.data
     print("Waiting for response...")
 
+    # Find the status this button belongs to ("confirm:<id>" or "cancel:<id>")
+    action, _, pending_id = data.partition(":")
+    blocks = pending_updates.pop(pending_id, query.from_user.id)
+    if blocks is False:
+        await query.answer("Only the sender can confirm this status update.")
+        return
+
     # Remove the buttons
     await query.edit_message_reply_markup(reply_markup=None)
 
-    if data == "cancel":
+    if action == "cancel":
         await query.message.reply_text("❌ Status update cancelled.")
         return
+    blocks = [block for block in blocks or [] if block.status]
+    if not blocks:
+        print(f"⚠️ Error: No pending status found for '{data}'.")
+        await query.message.reply_text("⌛ This status update has expired, please send it again.")
+        return
     loading = await query.message.reply_text("🔄 Updating status...")
 
-    # Get data and update sheet
-    status, informal_status, location, names, all_flag, date_text, reason, sheets_to_update, informal_sheets_to_update = context.user_data.pop('status_data', (None,)*9)
+    # Read every sheet needed in two parallel round-trips, updates below use the cached snapshots
+    await prefetch_snapshots(
+        list(dict.fromkeys(name for block in blocks for name in block.sheets_to_update)),
+        list(dict.fromkeys(name for block in blocks for name in block.informal_sheets_to_update))
+    )
 
-    if not status:
-        print("⚠️ Error: No data found in context.")
-        return
-    
-    # Update excel sheets
+    # Update excel sheets (Changes of every block are collected and written together at the end, later blocks win)
+    plan = WritePlan()
+    complete_sheets, block_names = True, []
+    for block in blocks:
+        complete, names = await apply_status_message(block, plan)
+        complete_sheets = complete and complete_sheets
+        block_names.append(names)
+
+    # One write per spreadsheet
+    complete_writes, failures = await plan.flush()
+    for failure in failures:
+        print(f"⚠️ Error during batch update: {failure}")
+
+    complete_data = True
+    for block, names in zip(blocks, block_names):
+        complete_data = await update_data_sheet(block.status, block.informal_status, names, block.all_flag, block.date_text, block.location, block.reason, block.sheets_to_update, block.informal_sheets_to_update) and complete_data
+
+    if complete_sheets and complete_writes and complete_data:
+        await loading.edit_text("✅ All updates completed!")
+    else:
+        await loading.edit_text("⚠️ Error: Check logs for issue...\n" + "\n".join(failures[:10]))
+
+async def apply_status_message(status_data, plan):
+    # Queue one status block's changes in the plan, returns (success, names updated)
+    status, informal_status, location, names, all_flag, date_text, reason, sheets_to_update, informal_sheets_to_update = status_data.status, status_data.informal_status, status_data.location, status_data.names, status_data.all_flag, status_data.date_text, status_data.reason, status_data.sheets_to_update, status_data.informal_sheets_to_update
+    complete_formal, complete_informal = True, True
     if all_flag:
         for sheet in sheets_to_update:
-            names = get_unchanged_names(sheet)
-            complete_formal = await update_sheet(status, location, names, date_text, reason, [sheet], chat_id)
+            names = await get_unchanged_names(sheet, plan=plan) # Skips people given a status earlier in the message
+            complete_formal = await update_sheet(status, location, names, date_text, reason, [sheet], current_chat_id.get(), plan=plan) and complete_formal
 
             # Dynamically find matching informal sheet
             informal_sheet = next((s for s in informal_sheets_to_update if sheet in s), None)
             if informal_sheet:
-                complete_informal = await update_informal_sheet(informal_status, names, date_text, [informal_sheet], chat_id)
+                complete_informal = await update_informal_sheet(informal_status, names, date_text, [informal_sheet], current_chat_id.get(), plan=plan) and complete_informal
     else:
-        complete_formal = await update_sheet(status, location, names, date_text, reason, sheets_to_update, chat_id)
-        complete_informal = await update_informal_sheet(informal_status, names, date_text, informal_sheets_to_update, chat_id)
-
-    complete_data = await update_data_sheet(status, informal_status, names, all_flag, date_text, location, reason, sheets_to_update, informal_sheets_to_update)
-
-    if complete_formal and complete_informal and complete_data:
-        await loading.edit_text(
-    "✅ All updates completed!" if complete_formal and complete_informal
-    else "⚠️ Error: Check logs for issue...")
+        complete_formal = await update_sheet(status, location, names, date_text, reason, sheets_to_update, current_chat_id.get(), plan=plan)
+        complete_informal = await update_informal_sheet(informal_status, names, date_text, informal_sheets_to_update, current_chat_id.get(), plan=plan)
+    return complete_formal and complete_informal, names
 
 ptb.add_handler(CallbackQueryHandler(handle_confirmation))
 
@@ -492,78 +919,144 @@ informal_status_mapping = {
     1 : 1
 }
 
+# Compiled status keyword matchers (Built once, longest keyword wins instead of dict order)
+def build_status_matcher(mapping):
+    keywords = {}
+    for keyword in mapping:
+        if isinstance(keyword, str):
+            keywords["".join(keyword.upper().split())] = keyword # "Stay-in" / "Stayin" / "Stay in" all find "STAY IN"
+    # Longest first so the alternation prefers "UDO REST" over "UDO" and "TIME OFF" over "OFF"
+    ordered = sorted(keywords.values(), key=len, reverse=True)
+    # Plurals ("MCs", "Courses") still match, single letter keywords don't take an "s"
+    patterns = [r"[\s\-]*".join(re.escape(word) for word in keyword.split()) + ("S?" if len(keyword) > 1 else "") for keyword in ordered]
+    # Keywords must stand alone, so "C", "L", "O" and "TO" no longer match inside other words
+    pattern = re.compile(r"(?<![A-Z0-9])(?:" + "|".join(patterns) + r")(?![A-Z0-9])", re.IGNORECASE)
+    return pattern, keywords
+
+def match_status(raw_status, matcher, mapping, default="Invalid"):
+    pattern, keywords = matcher
+    best = None
+    for match in pattern.finditer(raw_status):
+        found = "".join(re.split(r"[\s\-]+", match.group(0).upper()))
+        keyword = keywords[found] if found in keywords else keywords[found[:-1]] # Plural
+        if best is None or len(keyword) > len(best): # Ties go to the earliest keyword
+            best = keyword
+    return mapping[best] if best is not None else default
+
+official_status_matcher = build_status_matcher(official_status_mapping)
+informal_status_matcher = build_status_matcher(informal_status_mapping)
+
 # Step 6: Extract information
+# Status message fields, compiled once (The outer group names the field, the inner group holds its value)
+LINE_PATTERN = re.compile(r"""
+    (?P<status>Status\s*:?\s*(.*))
+    |(?P<names>R/Names?\s*:?\s*(.*))
+    |(?P<date>Dates?\s*:?\s*(.*))
+    |(?P<location>Locations?\s*:?\s*(.*))
+    |(?P<mc>MC\s*(?:(?:No|Number)\s*\.?|(?![A-Za-z]))\s*:?\s*(.*))
+    |(?P<reason>(?:Reasons?|Remarks?)\s*:?\s*(.*))
+""", re.IGNORECASE | re.VERBOSE)
+# "Status: {Status} @ {Location}", "to" and "at" only count as whole words
+STATUS_LOCATION_PATTERN = re.compile(r"(.+?)(?:\s*@\s*|\s+(?:to|at)\s+)(.+)", re.IGNORECASE)
+# Regex pattern to match "AM", "(AM)", "PM", or "(PM)"
+AM_PM_PATTERN = re.compile(r"(?:\s*\b(?:AM|PM)\b\s*|\s*\((?:AM|PM)\)\s*)")
+AM_PATTERN, PM_PATTERN = re.compile(r"\b(AM)\b"), re.compile(r"\b(PM)\b")
+DATE_RANGE_TO_PATTERN = re.compile(r"\s*to\s*")
+# Regular expression for 6-digit (DDMMYY) dates
+SIX_DIGIT_PATTERN = re.compile(r"\b(\d{1,2})[\/]?(\d{1,2})[\/]?(\d{2,4})\b")
+
+class StatusMessage:
+    __slots__ = ("status", "informal_status", "location", "names", "all_flag", "date_text", "reason", "sheets_to_update", "informal_sheets_to_update")
+
+    def __init__(self, status, informal_status, location, names, all_flag, date_text, reason, sheets_to_update, informal_sheets_to_update):
+        self.status = status
+        self.informal_status = informal_status
+        self.location = location
+        self.names = names
+        self.all_flag = all_flag
+        self.date_text = date_text
+        self.reason = reason
+        self.sheets_to_update = sheets_to_update
+        self.informal_sheets_to_update = informal_sheets_to_update
+
+def split_status_blocks(message):
+    # A message can hold several statuses, each block starts at its own "Status:" line
+    blocks = []
+    for line in message.split("\n"):
+        match = LINE_PATTERN.match(line.strip())
+        if (match and match.lastgroup == "status") or not blocks:
+            blocks.append([])
+        blocks[-1].append(line)
+    return ["\n".join(block) for block in blocks]
+
+@timed("extract_message")
 def extract_message(message):
-    lines = message.split("\n")
-
-    # Extract Status and Location (if in "Status:")
-    status_match = re.search(r"Status\s*:?\s*(.+?)\s*(?:\s*(?:@|to|at)\s*(.+))?$", message, re.IGNORECASE | re.MULTILINE)
-    raw_status = status_match.group(1).strip() if status_match else "Unknown"
-    raw_location = status_match.group(2).strip() if status_match and status_match.group(2) else ""
-    # Formatting location
-    # Regex pattern to match "AM", "(AM)", "PM", or "(PM)"
-    am_pm_pattern = r"(?:\s*\b(?:AM|PM)\b\s*|\s*\((?:AM|PM)\)\s*)"
-    location = re.sub(am_pm_pattern, "", raw_location)
-
-    # Convert status to official version
-    status = "Invalid"
-    for keyword in official_status_mapping.keys():
-        if keyword.upper() in raw_status.upper():  # Case-insensitive matching
-            status = official_status_mapping[keyword]  # Return mapped status
-            break
-    # Convert status to informal version
-    for keyword in informal_status_mapping.keys():
-        if keyword.upper() in raw_status.upper():  # Case-insensitive matching
-            informal_status = informal_status_mapping[keyword]  # Return mapped status
-            break
+    raw_status, raw_location, location, raw_date_text = None, "", None, None
+    name_lines, reason, mc_no = [], "", None
+    name_section, names_done, waiting_for_date = False, False, False
 
-    if status == "Invalid":
-        print(f"⚠️ Error: '{raw_status}' is not a valid status.")
-
-    # Extract Names (Handles "R/Name" with or without ":" and same-line names)
-    name_lines = []
-    name_section = False
-    all_flag = False
-
-    for line in lines:
+    # Classify every line in one pass
+    for line in message.split("\n"):
         line = line.strip()
-        # If "R/Name" is found, start capturing names
-        match = re.match(r"R/Names?\s*:?\s*(.*)", line, re.IGNORECASE)
-        if match:
-            name_section = True
-            names_in_line = match.group(1).strip()
-            if names_in_line:  # If names are on the same line as "R/Name"
-                # name_lines.extend(names_in_line.split("\n"))  
-                name_lines.extend([n.strip() for n in names_in_line.split(",")]) # Handles multiple names in one line
+        match = LINE_PATTERN.match(line)
+        if not match:
+            if waiting_for_date and line: # "Date:" with the date on the next line
+                raw_date_text, waiting_for_date = line, False
+            elif name_section:
+                name_lines.append(line)
             continue
+        field, value = match.lastgroup, match.group(match.lastindex + 1).strip()
 
-        # Stop capturing names if "Dates:" is found
-        elif re.match(r"Dates?\s*:?", line, re.IGNORECASE):
-            name_section = False
-            break  
-
-        # If inside the "R/Name" section, collect names
-        elif name_section:
-            name_lines.append(line)
+        if field == "status" and raw_status is None:
+            # Extract Status and Location (if in "Status:")
+            status_match = STATUS_LOCATION_PATTERN.fullmatch(value)
+            if status_match:
+                raw_status, raw_location = status_match.group(1).strip(), status_match.group(2).strip()
+            else:
+                raw_status = value or "Unknown"
+        elif field == "names":
+            # If "R/Name" is found, start capturing names (Names on the same line can be split by ",")
+            if not names_done:
+                name_section = True
+                if value:
+                    name_lines.extend([n.strip() for n in value.split(",")])
+        elif field == "date":
+            # Stop capturing names when "Dates:" is found
+            name_section, names_done = False, True
+            if raw_date_text is None:
+                raw_date_text = value
+                waiting_for_date = not value
+        elif field == "location":
+            location = value # Replaces location from "Status:"
+        elif field == "mc":
+            mc_no = value # MC number replaces the reason
+        elif field == "reason" and not reason:
+            reason = value
+
+    raw_status = raw_status or "Unknown"
+    raw_date_text = raw_date_text or ""
+    if location is None:
+        # Formatting location
+        location = AM_PM_PATTERN.sub("", raw_location)
+    if mc_no is not None:
+        reason = "MC No. " + mc_no
+
+    # Convert status to official and informal versions
+    status = match_status(raw_status, official_status_matcher, official_status_mapping)
+    informal_status = match_status(raw_status, informal_status_matcher, informal_status_mapping)
 
-    # Extract Dates
-    date_match = re.search(r"Dates?\s*:?\s*(.+)", message, re.IGNORECASE)
-    raw_date_text = date_match.group(1).strip() if date_match else ""
+    if status == "Invalid":
+        print(f"⚠️ Error: '{raw_status}' is not a valid status.")
     # print(f"Raw date text: {raw_date_text}") # Debugging
 
-    # Convert date to fixed format (DD/MM/YY)
-    # Regular expression for 6-digit (DDMMYY) dates
-    six_digit_pattern = r"\b(\d{1,2})[\/]?(\d{1,2})[\/]?(\d{2,4})\b"
-
     # Check if it's a range (date-date or date - date)
     sheets_to_update, informal_sheets_to_update = [], []
-    timezone = datetime.now(ZoneInfo("UTC")).astimezone(ZoneInfo("Asia/Singapore"))
+    timezone = singapore_now()
     informal_sheet_name = timezone.strftime("%b %y")
 
     # Format range dates
     if "to" in raw_date_text:
-        raw_date_text = re.sub(r"\s*to\s*", " - ", raw_date_text)
-    am_pattern, pm_pattern = r"\b(AM)\b", r"\b(PM)\b"
+        raw_date_text = DATE_RANGE_TO_PATTERN.sub(" - ", raw_date_text)
 
     if "-" in raw_date_text:
         # Normalize spaces around "-" and split the range
@@ -571,18 +1064,18 @@ def extract_message(message):
 
         # Determine AM or PM from both start and end dates
         start_period, end_period = "", ""
-        if re.search(am_pattern, start_date.upper()):
+        if AM_PATTERN.search(start_date.upper()):
             start_period = " (AM)"
-        elif re.search(pm_pattern, start_date.upper()):
+        elif PM_PATTERN.search(start_date.upper()):
             start_period = " (PM)"
-        if re.search(am_pattern, end_date.upper()):
+        if AM_PATTERN.search(end_date.upper()):
             end_period = " (AM)"
-        elif re.search(pm_pattern, end_date.upper()):
+        elif PM_PATTERN.search(end_date.upper()):
             end_period = " (PM)"
 
         # Format dates
-        start_date = format_date(start_date, six_digit_pattern)
-        end_date = format_date(end_date, six_digit_pattern)
+        start_date = format_date(start_date, SIX_DIGIT_PATTERN)
+        end_date = format_date(end_date, SIX_DIGIT_PATTERN)
         # Convert individual dates
         date_text = f"{start_date}{start_period} - {end_date}{end_period}"
 
@@ -592,7 +1085,7 @@ def extract_message(message):
 
     else:
         # Format single date
-        date_text = format_date(raw_date_text, six_digit_pattern)
+        date_text = format_date(raw_date_text, SIX_DIGIT_PATTERN)
 
         # Determine AM or PM
         # Combine text inputs to check for AM or PM
@@ -600,10 +1093,10 @@ def extract_message(message):
 
         # Determine AM or PM
         start_am, start_pm = False, False
-        if re.search(am_pattern, combined_text):
+        if AM_PATTERN.search(combined_text):
             start_am = True
             date_text += " (AM)"
-        elif re.search(pm_pattern, combined_text):
+        elif PM_PATTERN.search(combined_text):
             start_pm = True
             date_text += " (PM)"
         
@@ -626,28 +1119,7 @@ def extract_message(message):
         sheets_to_update = ["NIGHT"] # Only night sheet to be updated
         informal_sheets_to_update = []
 
-    # Extract Location and Reason (if provided separately)
-    reason = "" # Location already has a check
-    for line in lines:
-        location_match = re.match(r"Locations?\s*:?\s*(.*)", line, re.IGNORECASE)
-        if location_match:
-            location = location_match.group(1).strip()        
-
-        # Extract the mc number and replace the reason
-        mc_no_match = re.match(r"MC\s*(No|Number)?\s*\.?:?\s*(.*)", line, re.IGNORECASE)
-        if mc_no_match:
-            reason = "MC No. " + mc_no_match.group(2).strip()
-            continue
-
-        # Extract reason or remark if no mc number
-        if not reason:
-            reason_match = re.match(r"Reasons?\s*:?\s*(.*)", line, re.IGNORECASE)
-            remark_match = re.match(r"Remarks?\s*:?\s*(.*)", line, re.IGNORECASE)
-            if reason_match:
-                reason = reason_match.group(1).strip()
-            elif remark_match:
-                reason = remark_match.group(1).strip()
-
+    all_flag = False
     ranks = KNOWN_RANKS
     if any(name.strip().lower() == "all" for name in name_lines):
         all_flag, names = True, ["Everyone without a status"]
@@ -677,22 +1149,17 @@ def extract_message(message):
     print("Extracted Reason:", reason)
     print("Sheets to update:", sheets_to_update)
     print("Informal Sheets to update:", informal_sheets_to_update)
-    return {
-        "status": status,
-        "informal_status": informal_status,
-        "names": names,
-        "all_flag": all_flag,
-        "date_text": date_text,
-        "location": location,
-        "reason": reason,
-        "sheets_to_update": sheets_to_update,
-        "informal_sheets_to_update": informal_sheets_to_update
-    }
+    return StatusMessage(status, informal_status, location, names, all_flag, date_text, reason, sheets_to_update, informal_sheets_to_update)
+
+def singapore_now():
+    # Every date decision goes through here (benchmark.py pins it to a fixed time)
+    return datetime.now(ZoneInfo("UTC")).astimezone(ZoneInfo("Asia/Singapore"))
 
 def extract_days(date_text):
     # Regex pattern to match date format and extract the day (the first two digits)
     day_pattern = r'(\d{1,2})/(\d{2})/(\d{2})'
-    current_year, current_month = int(datetime.now().year % 100), int(datetime.now().month)
+    now = singapore_now()
+    current_year, current_month = now.year % 100, now.month
 
     # Search for all matches of the day pattern
     date = re.findall(day_pattern, date_text)
@@ -722,6 +1189,16 @@ def extract_days(date_text):
         # In case of an unexpected format, return empty list
         return []
 
+def column_spans(cols):
+    # Sorted column indices -> (first, last) of each run of neighbouring columns
+    spans = []
+    for col in cols:
+        if spans and col == spans[-1][1] + 1:
+            spans[-1][1] = col
+        else:
+            spans.append([col, col])
+    return [tuple(span) for span in spans]
+
 def get_column_letter(index):
     # Convert a 0-based column index to Excel-style column letters.
     letters = ""
@@ -730,35 +1207,146 @@ def get_column_letter(index):
         index = index // 26 - 1
     return letters
 
-def find_name_index(df, name, sheet_name, official):
-    if official:
-        matching_rows = df[(df["Name"].str.contains(name, case=False, na=False)) & (df["Platoon"] == "AE")].index.tolist()
-    else:
-        matching_rows = df[df["Name"].str.contains(name, case=False, na=False)].index.tolist()
-    
+def normalize_name(name):
+    return " ".join(name.lower().split())
+
+# Roster name index (Built once per snapshot, replaces scanning the Name column for every lookup)
+class NameIndex:
+    __slots__ = ("rows", "positions", "names", "lowered", "squished", "name_grams", "squished_grams", "hits", "exact", "signature")
+
+    def __init__(self, values, official):
+        headers = [header.strip() for header in values[1]] if len(values) > 1 else []
+        name_col = headers.index("Name") if "Name" in headers else None
+        platoon_col = headers.index("Platoon") if "Platoon" in headers else None
+
+        self.rows, self.names, self.lowered, self.squished = [], [], [], []
+        self.positions = {} # Row in data -> position in index
+        self.name_grams, self.squished_grams = {}, {}
+        self.hits = {} # (field, text) -> matching rows, names repeat a lot
+        self.exact = {} # Normalized full name -> sheet row (None if the name appears twice)
+        self.signature = None
+        if name_col is None:
+            return
+        for i, row in enumerate(values[2:]): # Data starts from the third row
+            name = row[name_col] if name_col < len(row) else ""
+            if official: # Platoon filter is baked into the index
+                platoon = row[platoon_col] if platoon_col is not None and platoon_col < len(row) else ""
+                if platoon != "AE":
+                    continue
+            position = len(self.rows)
+            self.rows.append(i)
+            self.positions[i] = position
+            self.names.append(name)
+            self.lowered.append(name.lower())
+            self.squished.append(name.replace(" ", "").lower())
+            for gram in self._grams(self.lowered[position]):
+                self.name_grams.setdefault(gram, []).append(position)
+            for gram in self._grams(self.squished[position]):
+                self.squished_grams.setdefault(gram, []).append(position)
+            normalized = normalize_name(name)
+            self.exact[normalized] = None if normalized in self.exact else i + 3 # Adjusting for header rows
+        # Same roster (Names in the same rows) gives the same signature across downloads
+        self.signature = hash((tuple(self.rows), tuple(self.names)))
+
+    @staticmethod
+    def _grams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def search(self, text, squished):
+        # Rows whose name contains text (Case-insensitive substring, same as str.contains)
+        key = (squished, text)
+        if key in self.hits:
+            return self.hits[key]
+        text = text.lower()
+        fields = self.squished if squished else self.lowered
+        grams = self._grams(text)
+        if grams: # Only rows sharing every trigram can contain the text
+            postings = self.squished_grams if squished else self.name_grams
+            lists = sorted((postings.get(gram, []) for gram in grams), key=len)
+            candidates = set(lists[0])
+            for posting in lists[1:]:
+                if not candidates:
+                    break
+                candidates.intersection_update(posting)
+            candidates = sorted(candidates)
+        else: # Too short for trigrams
+            candidates = range(len(fields))
+        matches = [self.rows[p] for p in candidates if text in fields[p]]
+        self.hits[key] = matches
+        return matches
+
+    def name_at(self, row_index):
+        # Roster name of a sheet row number
+        return self.names[self.positions[row_index - 3]]
+
+async def get_name_index(spreadsheet, sheet_name, official):
+    values = await get_sheet_values(spreadsheet, sheet_name) # Make sure the snapshot is fresh
+    entry = sheet_cache.get((spreadsheet.id, sheet_name))
+    if entry is None or entry["values"] is not values: # Snapshot was not cached, index it once
+        return NameIndex(values, official)
+    indexes = entry.setdefault("indexes", {})
+    if official not in indexes:
+        indexes[official] = NameIndex(entry["values"], official)
+    return indexes[official]
+
+# Cross-sheet name resolution memo (Same people report every day, resolve each of them once)
+name_identities = {} # Normalized message name -> normalized roster name
+resolved_rows = {} # (spreadsheet id, worksheet title, official) -> {"signature": roster signature, "rows": {normalized message name: row}}
+
+async def resolve_name(spreadsheet, sheet_name, name, official):
+    name_index = await get_name_index(spreadsheet, sheet_name, official)
+    key = normalize_name(name)
+    memo_key = (spreadsheet.id, sheet_name, official)
+    memo = resolved_rows.get(memo_key)
+    if memo is None or memo["signature"] != name_index.signature:
+        if memo is not None: # Roster changed, identities may point to the wrong people
+            print(f"🔄 Roster of '{sheet_name}' sheet changed, clearing remembered names.")
+            name_identities.clear()
+        memo = {"signature": name_index.signature, "rows": {}}
+        resolved_rows[memo_key] = memo
+
+    if key in memo["rows"]:
+        row_index = memo["rows"][key]
+        if row_index != None:
+            print(f"✅ Remembered match: '{name}' in row {row_index} | {name_index.name_at(row_index)}")
+        return row_index
+
+    # Person already resolved in another sheet, look up their roster name directly
+    row_index = None
+    identity = name_identities.get(key)
+    if identity is not None:
+        row_index = name_index.exact.get(identity)
+        if row_index != None:
+            print(f"✅ Known person: '{name}' matched in row {row_index} | {name_index.name_at(row_index)}")
+    if row_index == None:
+        row_index = find_name_index(name_index, name, sheet_name)
+        if row_index != None:
+            name_identities[key] = normalize_name(name_index.name_at(row_index))
+
+    memo["rows"][key] = row_index
+    return row_index
+
+@timed("find_name_index")
+def find_name_index(name_index, name, sheet_name):
+    matching_rows = name_index.search(name, squished=False)
+
     # 1. Direct Substring Match
     if len(matching_rows) == 1:
         row_index = matching_rows[0] + 3  # Adjusting for header rows
-        print(f"✅ Direct match found: '{name}' matched in row {row_index} | {df['Name'][matching_rows[0]]}")
+        print(f"✅ Direct match found: '{name}' matched in row {row_index} | {name_index.name_at(row_index)}")
         return row_index
-    
-    # Squishing names by removing spaces
-    df["Squished_Name"] = df["Name"].str.replace(" ", "")    
 
-    # 2. Name Part Match
+    # 2. Name Part Match (Against names with spaces removed)
     name_parts = name.split()
     part_matches = []  # Store all rows that match name parts
     for part in name_parts:
         # print(part)
-        if official:
-            partial_matching_rows = df[(df["Squished_Name"].str.contains(part, case=False, na=False)) & (df["Platoon"] == "AE")].index.tolist()
-        else:
-            partial_matching_rows = df[df["Squished_Name"].str.contains(part, case=False, na=False)].index.tolist()
+        partial_matching_rows = name_index.search(part, squished=True)
         part_matches.extend(partial_matching_rows)
 
         if len(partial_matching_rows) == 1:  # Found an exact match for a part
             row_index = partial_matching_rows[0] + 3  # Adjusting for header rows
-            print(f"✅ Part match found: '{part}' matched in row {row_index} | {df['Name'][partial_matching_rows[0]]}")
+            print(f"✅ Part match found: '{part}' matched in row {row_index} | {name_index.name_at(row_index)}")
             return row_index
         elif len(partial_matching_rows) == 0:
             print(f"⚠️ No matching name found for '{part}' in '{sheet_name}' sheet.")
@@ -781,28 +1369,210 @@ def find_name_index(df, name, sheet_name, official):
             print(f"⚠️ Equal matches found for '{name}' in rows: {most_common_rows}. Skipping...")
         else:
             row_index = most_common_rows[0] + 3  # Adjusting for header rows
-            print(f"✅ Most common match found for '{name}' in row {row_index} | {df['Name'][most_common_rows[0]]}")
+            print(f"✅ Most common match found for '{name}' in row {row_index} | {name_index.name_at(row_index)}")
             return row_index
 
     # No matches found
     print(f"⚠️ No valid matches found for '{name}' in '{sheet_name}' sheet.")
     return None
 
-def get_unchanged_names(sheet_name):
+# Roster table (Lightweight view of a snapshot, replaces a DataFrame for lookups by column)
+class RosterTable:
+    __slots__ = ("headers", "columns", "rows", "blocks")
+
+    def __init__(self, values):
+        self.headers = [header.strip() for header in values[1]] if len(values) > 1 else [] # Second row holds the headers
+        self.columns = {} # Header -> column index (First one if repeated)
+        for i, header in enumerate(self.headers):
+            self.columns.setdefault(header, i)
+        self.rows = values[2:] # Shares the snapshot's row lists, data starts from the third row
+        self.blocks = {} # (header, value) -> range of rows, like the AE platoon
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get(self, i, col):
+        row = self.rows[i]
+        return row[col] if col < len(row) else ""
+
+    def find(self, header, value, start=0):
+        # First row from start with this value, None if there is none
+        col = self.columns.get(header)
+        if col is not None:
+            for i in range(start, len(self.rows)):
+                if self.get(i, col) == value:
+                    return i
+        return None
+
+    def block(self, header, value):
+        # Rows from the first match until the value changes (Platoon blocks are contiguous)
+        key = (header, value)
+        if key not in self.blocks:
+            start = self.find(header, value)
+            stop = start
+            if start is not None:
+                col = self.columns[header]
+                while stop < len(self.rows) and self.get(stop, col) == value:
+                    stop += 1
+            self.blocks[key] = range(start or 0, stop or 0)
+        return self.blocks[key]
+
+def get_roster_table(spreadsheet, sheet_name, values):
+    # Built once per cached snapshot, dropped when the snapshot is written to
+    entry = sheet_cache.get((spreadsheet.id, sheet_name))
+    if entry is None or entry["values"] is not values:
+        return RosterTable(values)
+    if "table" not in entry:
+        entry["table"] = RosterTable(values)
+    return entry["table"]
+
+# Expiry calendar (Which AE rows end on which day, so the nightly check skips everyone else)
+def parse_end_date(date_text):
+    # "DD/MM/YY (AM) - DD/MM/YY (PM)" -> (end date, "AM", "PM" or None), ValueError if the date is unreadable
+    end_text = date_text.split("-")[-1]
+    end_date = datetime.strptime(end_text.replace("(AM)", "").replace("(PM)", "").strip(), "%d/%m/%y").date()
+    if "(AM)" in end_text.upper():
+        return end_date, "AM"
+    elif "(PM)" in end_text.upper():
+        return end_date, "PM"
+    return end_date, None
+
+VECTORIZED_DATE_ROWS = int(os.getenv("Vectorized_Date_Rows", "2000")) # Rosters at least this big parse dates column-wise with pandas (Below this the row loop is faster)
+
+def parse_end_dates(date_texts):
+    # Column-wise parse_end_date, None instead of ValueError (pandas is only imported for big rosters)
+    import pandas as pd
+    end_text = pd.Series(date_texts, dtype="object").str.split("-").str[-1]
+    cleaned = end_text.str.replace("(AM)", "", regex=False).str.replace("(PM)", "", regex=False).str.strip()
+    end_dates = pd.to_datetime(cleaned, format="%d/%m/%y", errors="coerce")
+    return [None if pd.isna(end_date) else end_date.date() for end_date in end_dates]
+
+# People who stay in on weekday nights
+STAY_IN_PEOPLE = frozenset({"Ong Jun Wei", "Thong Wai Hung",
+                            "Lim Jia Hao", "Alfred Leandro Liang",
+                            "Haziq Syahmi Bin Norzaim", "Huang Shifeng"})
+
+class ExpiryCalendar:
+    __slots__ = ("rows", "date_col", "status_col", "days", "ends", "stay_in", "invalid", "people")
+
+    def __init__(self, table, end_dates=None):
+        # end_dates: Parsed end date of every AE row (None if unreadable), parsed here if not given
+        self.rows = table.block("Platoon", "AE")
+        self.date_col, self.status_col = table.columns.get("Date"), table.columns.get("Status")
+        self.days = {} # End date -> rows ending that day
+        self.ends = {} # Row -> end date
+        self.stay_in = set() # Undated rows staying in (Reset on the NIGHT sheet)
+        self.invalid = set() # Rows with an unreadable date
+        self.people = {} # Stay in person -> their rows (Names can repeat, name writes rebuild the calendar)
+        name_col = table.columns.get("Name")
+        if name_col is not None:
+            for i in self.rows:
+                name = table.get(i, name_col)
+                if name in STAY_IN_PEOPLE:
+                    self.people.setdefault(name, set()).add(i)
+        if self.date_col is None or self.status_col is None:
+            return
+        for position, i in enumerate(self.rows):
+            if end_dates is None:
+                self.index_row(i, table.get(i, self.date_col), table.get(i, self.status_col))
+            else:
+                self.index_row(i, table.get(i, self.date_col), table.get(i, self.status_col), end_dates[position], parsed=True)
+
+    def index_row(self, i, raw_date, status, end_date=None, parsed=False):
+        self.forget_row(i)
+        date_text = raw_date.strip()
+        if not date_text:
+            if status == "P - STAY IN SGC 377":
+                self.stay_in.add(i)
+            return
+        if not parsed:
+            try:
+                end_date, _ = parse_end_date(date_text)
+            except ValueError:
+                end_date = None
+        if end_date is None:
+            self.invalid.add(i)
+            return
+        self.ends[i] = end_date
+        self.days.setdefault(end_date, set()).add(i)
+
+    def forget_row(self, i):
+        self.stay_in.discard(i)
+        self.invalid.discard(i)
+        end_date = self.ends.pop(i, None)
+        if end_date is not None:
+            self.days[end_date].discard(i)
+            if not self.days[end_date]:
+                del self.days[end_date]
+
+    def update(self, values, i):
+        # Keeps a written row in step with the snapshot (i counts from the first data row)
+        if i in self.rows and self.date_col is not None and self.status_col is not None:
+            row = values[i + 2]
+            cell = lambda col: row[col] if col < len(row) else ""
+            self.index_row(i, cell(self.date_col), cell(self.status_col))
+
+    def rows_of(self, names):
+        # Rows of these stay in people
+        rows = set()
+        for name in names:
+            rows |= self.people.get(name, set())
+        return rows
+
+    def due(self, day):
+        # Rows ending on or before day
+        rows = set()
+        for end_date in [end_date for end_date in self.days if end_date <= day]:
+            rows |= self.days[end_date]
+        return rows
+
+def get_expiry_calendars(spreadsheet, snapshots):
+    # Built once per cached snapshot and updated in place by our own writes
+    # Big rosters have the Date columns of every sheet parsed in one column-wise pass
+    calendars, missing = {}, {}
+    for sheet_name, values in snapshots.items():
+        entry = sheet_cache.get((spreadsheet.id, sheet_name))
+        if entry is not None and entry["values"] is values and "expiry" in entry:
+            calendars[sheet_name] = entry["expiry"]
+        else:
+            missing[sheet_name] = get_roster_table(spreadsheet, sheet_name, values)
+
+    date_texts, spans = [], {} # All AE Date cells end to end, sheet name -> (start, stop) in date_texts
+    for sheet_name, table in missing.items():
+        date_col, ae_rows = table.columns.get("Date"), table.block("Platoon", "AE")
+        if date_col is not None:
+            spans[sheet_name] = (len(date_texts), len(date_texts) + len(ae_rows))
+            date_texts.extend(table.get(i, date_col).strip() for i in ae_rows)
+    end_dates = None
+    if len(date_texts) >= VECTORIZED_DATE_ROWS:
+        try:
+            end_dates = parse_end_dates(date_texts)
+        except ImportError:
+            print("⚠️ pandas not installed, parsing dates row by row.")
+
+    for sheet_name, table in missing.items():
+        span = spans.get(sheet_name)
+        sheet_dates = end_dates[span[0]:span[1]] if end_dates is not None and span else None
+        calendars[sheet_name] = ExpiryCalendar(table, sheet_dates)
+        entry = sheet_cache.get((spreadsheet.id, sheet_name))
+        if entry is not None and entry["values"] is snapshots[sheet_name]:
+            entry["expiry"] = calendars[sheet_name]
+    return calendars
+
+async def get_unchanged_names(sheet_name, plan=None):
     try:
-        worksheet = sheet.worksheet(sheet_name)
-        data = worksheet.get_all_values()
-        headers = data[1]
-        df = pd.DataFrame(data[2:], columns=headers)
+        data = await get_sheet_values(sheet, sheet_name)
+        table = get_roster_table(sheet, sheet_name, data)
+        name_col, status_col = table.columns["Name"], table.columns["Status"]
+        status_letter = chr(65 + status_col)
 
         # Slice to only AE platoon people with valid status
         unchanged_names = []
-        first_ae_index = df[df["Platoon"] == "AE"].index.min()
-        for i, row in df.iloc[first_ae_index:].iterrows():
-            platoon, name, date_range, current_status = row["Platoon"], row["Name"], row["Date"].strip(), row["Status"]
-            if platoon != "AE": # Stops when no longer AE ppl
-                break
-            if platoon == "AE" and current_status in ["PRESENT", "P - STAY IN SGC 377", "P - STAY OUT"]:
+        for i in table.block("Platoon", "AE"):
+            name, current_status = table.get(i, name_col), table.get(i, status_col)
+            if plan is not None: # Status queued but not written yet
+                current_status = plan.planned(sheet, sheet_name, f"{status_letter}{i + 3}", current_status)
+            if current_status in ["PRESENT", "P - STAY IN SGC 377", "P - STAY OUT"]:
                 unchanged_names.append(name)
         return unchanged_names
     except Exception as e:
@@ -810,7 +1580,7 @@ def get_unchanged_names(sheet_name):
         return []
 
 def format_date(raw_date, pattern):
-    match = re.search(pattern, raw_date)
+    match = pattern.search(raw_date)
     if match:
         day, month, year = match.groups()
         if len(year) == 4:
@@ -833,15 +1603,434 @@ def clean_value(value):
         return json.dumps(value)
     return str(value)
 
+# Blocking gspread calls run on a small thread pool so the webhook and other chats are not frozen
+SHEETS_WORKERS = int(os.getenv("Sheets_Workers", "4"))
+sheets_executor = ThreadPoolExecutor(max_workers=SHEETS_WORKERS, thread_name_prefix="sheets")
+
+async def run_sheets(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context() # Carries the current flow into the thread for request accounting
+    return await loop.run_in_executor(sheets_executor, context.run, functools.partial(func, *args, **kwargs))
+
+def write_sheet_updates(spreadsheet, sheet_name, updates):
+    worksheet = get_worksheet(spreadsheet, sheet_name)
+    sheets_call("write", worksheet.batch_update, updates)
+
+# Sheets API quota governor (Every gspread request goes through sheets_call)
+SHEETS_READS_PER_MINUTE = int(os.getenv("Sheets_Reads_Per_Minute", "60"))
+SHEETS_WRITES_PER_MINUTE = int(os.getenv("Sheets_Writes_Per_Minute", "60"))
+SHEETS_MAX_RETRIES = int(os.getenv("Sheets_Max_Retries", "5")) # Per request
+SHEETS_RETRY_BUDGET = int(os.getenv("Sheets_Retry_Budget", "20")) # Retries per minute across all requests
+SHEETS_BACKOFF_BASE, SHEETS_BACKOFF_CAP = 1, 32 # Seconds
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    # Thread-safe, callers in the sheets pool block until their request fits in the per-minute quota (Also paces Telegram sends per chat)
+    def __init__(self, per_minute):
+        self.capacity = max(1, per_minute // 4) # Burst plus refill stays within any rolling minute
+        self.rate = max(per_minute - self.capacity, 1) / 60
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        # Takes a token if one is ready, otherwise returns seconds until the next one (For callers that sleep on their own)
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self.paused_until and self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return max(self.paused_until - now, (1 - self.tokens) / self.rate)
+
+    def acquire(self):
+        # Returns seconds spent waiting
+        waited = 0
+        while True:
+            delay = self.reserve()
+            if not delay:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    def try_acquire(self):
+        with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def pause(self, seconds):
+        # Quota exceeded, hold every request of this kind
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0
+
+sheets_buckets = {"read": TokenBucket(SHEETS_READS_PER_MINUTE), "write": TokenBucket(SHEETS_WRITES_PER_MINUTE)}
+retry_budget = TokenBucket(SHEETS_RETRY_BUDGET)
+sheets_stats = {"requests": {}, "retries": {}, "failures": {}, "throttled_seconds": 0.0} # Counters keyed by "flow:kind"
+sheets_stats_lock = threading.Lock()
+
+def count_sheets_stat(counter, kind, amount=1):
+    key = f"{current_flow.get()}:{kind}"
+    with sheets_stats_lock:
+        sheets_stats[counter][key] = sheets_stats[counter].get(key, 0) + amount
+
+def get_retry_delay(error, attempt):
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.strip().isdigit():
+        return float(retry_after)
+    # Jittered exponential backoff
+    return random.uniform(0, min(SHEETS_BACKOFF_CAP, SHEETS_BACKOFF_BASE * 2 ** attempt))
+
+def sheets_call(kind, func, *args, targets=None, **kwargs):
+    # targets: Worksheet titles a spreadsheet level batch request touches, counted once each
+    bucket = sheets_buckets[kind]
+    attempt = 0
+    while True:
+        waited = bucket.acquire()
+        if waited:
+            with sheets_stats_lock:
+                sheets_stats["throttled_seconds"] += waited
+        count_sheets_stat("requests", kind)
+        for target in targets or [getattr(getattr(func, "__self__", None), "title", "client")]:
+            sheets_target_requests.inc(kind, target)
+        try:
+            return func(*args, **kwargs)
+        except (gspread.exceptions.APIError, requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            response = getattr(e, "response", None)
+            status_code = response.status_code if response is not None else None
+            retryable = status_code in RETRYABLE_STATUS_CODES or not isinstance(e, gspread.exceptions.APIError)
+            if not retryable or attempt >= SHEETS_MAX_RETRIES or not retry_budget.try_acquire():
+                count_sheets_stat("failures", kind)
+                raise
+            delay = get_retry_delay(e, attempt)
+            if status_code == 429: # Slow every request down, not just this one
+                bucket.pause(delay)
+            count_sheets_stat("retries", kind)
+            print(f"⌛ Sheets {kind} failed ({status_code or type(e).__name__}), retry {attempt + 1} in {delay:.1f}s...")
+            time.sleep(delay)
+            attempt += 1
+
+
+# Worksheet handle registry (Tab metadata of each spreadsheet is loaded once instead of on every access)
+WORKSHEET_REFRESH_INTERVAL = 30 # Seconds between tab list reloads for names that don't exist yet
+worksheet_registry = {} # Spreadsheet id -> {"time": loaded at, "worksheets": {worksheet title: worksheet}}
+worksheet_registry_lock = threading.Lock() # Used from the sheets thread pool
+
+def load_worksheets(spreadsheet):
+    worksheets = {worksheet.title: worksheet for worksheet in sheets_call("read", spreadsheet.worksheets)}
+    worksheet_registry[spreadsheet.id] = {"time": time.monotonic(), "worksheets": worksheets}
+    print(f"📋 Loaded {len(worksheets)} tabs of '{spreadsheet.title}'.")
+    return worksheets
+
+def get_worksheet(spreadsheet, sheet_name):
+    with worksheet_registry_lock:
+        entry = worksheet_registry.get(spreadsheet.id)
+        if entry is None:
+            worksheets = load_worksheets(spreadsheet)
+        else:
+            worksheets = entry["worksheets"]
+            # New tab (Like a new month's "%b %y (AM)" sheet), load the tab list again
+            if sheet_name not in worksheets and time.monotonic() - entry["time"] >= WORKSHEET_REFRESH_INTERVAL:
+                worksheets = load_worksheets(spreadsheet)
+        if sheet_name not in worksheets:
+            raise gspread.exceptions.WorksheetNotFound(sheet_name)
+        return worksheets[sheet_name]
+
+def has_worksheet(spreadsheet, sheet_name):
+    try:
+        get_worksheet(spreadsheet, sheet_name)
+        return True
+    except gspread.exceptions.WorksheetNotFound:
+        return False
+
+def forget_worksheets(spreadsheet):
+    # Tabs renamed or deleted, load the tab list again on next access
+    with worksheet_registry_lock:
+        worksheet_registry.pop(spreadsheet.id, None)
+
+# Worksheet snapshot cache (Shared by every flow so one status doesn't download the same sheet again)
+SHEET_CACHE_TTL = float(os.getenv("Sheet_Cache_TTL", "60")) # Seconds before a snapshot is downloaded again
+sheet_cache = {} # (spreadsheet id, worksheet title) -> {"time": fetched at, "values": all values}
+
+sheet_fetches = {} # (spreadsheet id, worksheet title) -> (download in progress, version), shared by concurrent readers
+sheet_versions = {} # (spreadsheet id, worksheet title) -> bumped on every write, stale downloads are not cached
+
+async def get_sheet_values(spreadsheet, sheet_name):
+    key = (spreadsheet.id, sheet_name)
+    entry = sheet_cache.get(key)
+    if entry and time.monotonic() - entry["time"] < SHEET_CACHE_TTL:
+        print(f"📋 Using cached snapshot of '{sheet_name}' sheet.")
+        return entry["values"]
+
+    # Snapshot missing or expired, download again (Once, even if several handlers ask at the same time)
+    if key not in sheet_fetches:
+        fetch = asyncio.ensure_future(run_sheets(download_sheet_values, spreadsheet, sheet_name))
+        sheet_fetches[key] = (fetch, sheet_versions.get(key, 0))
+        fetch.add_done_callback(lambda _: sheet_fetches.pop(key, None))
+    fetch, version = sheet_fetches[key]
+    values = await asyncio.shield(fetch)
+    store_snapshot(key, version, values)
+    return values
+
+def store_snapshot(key, version, values):
+    # Cache a finished download unless the sheet was written since it started
+    cached = sheet_cache.get(key)
+    if sheet_versions.get(key, 0) == version and (cached is None or cached["values"] is not values):
+        sheet_cache[key] = {"time": time.monotonic(), "values": values}
+
+def download_sheet_values(spreadsheet, sheet_name):
+    worksheet = get_worksheet(spreadsheet, sheet_name)
+    return count_download(sheet_name, sheets_call("read", worksheet.get_all_values))
+
+def count_download(sheet_name, values):
+    sheets_downloaded_bytes.inc(sheet_name, amount=sum(len(cell) for row in values for cell in row))
+    return values
+
+# Bulk reads (Several worksheets of one spreadsheet in a single values:batchGet round-trip)
+async def get_sheet_snapshots(spreadsheet, sheet_names):
+    snapshots, missing = {}, []
+    for sheet_name in sheet_names:
+        key = (spreadsheet.id, sheet_name)
+        entry = sheet_cache.get(key)
+        if entry and time.monotonic() - entry["time"] < SHEET_CACHE_TTL:
+            snapshots[sheet_name] = entry["values"]
+        elif key not in sheet_fetches:
+            missing.append(sheet_name)
+
+    # One download for every missing sheet, registered per sheet so other readers join it
+    if missing:
+        batch = asyncio.ensure_future(run_sheets(download_sheet_batch, spreadsheet, missing))
+        for sheet_name in missing:
+            key = (spreadsheet.id, sheet_name)
+            version = sheet_versions.get(key, 0)
+            fetch = asyncio.ensure_future(pick_sheet_values(batch, sheet_name, key, version))
+            sheet_fetches[key] = (fetch, version)
+            fetch.add_done_callback(lambda _, key=key: sheet_fetches.pop(key, None))
+
+    for sheet_name in sheet_names:
+        if sheet_name in snapshots:
+            continue
+        try:
+            snapshots[sheet_name] = await get_sheet_values(spreadsheet, sheet_name) # Cached or joins the download
+        except Exception as e:
+            print(f"⚠️ Error reading '{sheet_name}' sheet: {e}")
+    return snapshots
+
+async def pick_sheet_values(batch, sheet_name, key, version):
+    values = (await batch)[sheet_name]
+    if isinstance(values, Exception):
+        raise values
+    # Cached before the fetch finishes, every sheet of the batch is found by the readers after it
+    store_snapshot(key, version, values)
+    return values
+
+def download_sheet_batch(spreadsheet, sheet_names):
+    # Missing tabs would fail the whole batch, leave them out
+    results = {}
+    for sheet_name in sheet_names:
+        if not has_worksheet(spreadsheet, sheet_name):
+            results[sheet_name] = gspread.exceptions.WorksheetNotFound(sheet_name)
+    sheet_names = [sheet_name for sheet_name in sheet_names if sheet_name not in results]
+    if not sheet_names:
+        return results
+
+    ranges = ["'{}'".format(sheet_name.replace("'", "''")) for sheet_name in sheet_names] # Whole sheet ranges
+    try:
+        response = sheets_call("read", spreadsheet.values_batch_get, ranges, targets=sheet_names)
+    except gspread.exceptions.APIError as e:
+        print(f"⚠️ Batch read failed ({e}), reading sheets one by one...")
+        forget_worksheets(spreadsheet) # Tabs may have been renamed
+        for sheet_name in sheet_names:
+            try:
+                results[sheet_name] = download_sheet_values(spreadsheet, sheet_name)
+            except Exception as e:
+                results[sheet_name] = e
+        return results
+
+    # Pad short rows like get_all_values does
+    for sheet_name, value_range in zip(sheet_names, response.get("valueRanges", [])):
+        values = value_range.get("values", [])
+        results[sheet_name] = count_download(sheet_name, gspread.utils.fill_gaps(values) if values else [])
+    return results
+
+async def prefetch_snapshots(sheets_to_update, informal_sheets_to_update):
+    # Formal and informal spreadsheets are read at the same time
+    await asyncio.gather(
+        get_sheet_snapshots(sheet, sheets_to_update),
+        get_sheet_snapshots(informal_sheet, informal_sheets_to_update)
+    )
+
+def invalidate_sheet_cache(spreadsheet, sheet_name):
+    # Drop one snapshot
+    key = (spreadsheet.id, sheet_name)
+    sheet_cache.pop(key, None)
+    sheet_versions[key] = sheet_versions.get(key, 0) + 1 # Downloads in progress are stale too
+
+def apply_updates_to_cache(spreadsheet, sheet_name, updates):
+    # Write-through: Copy our own batch updates into the cached snapshot
+    key = (spreadsheet.id, sheet_name)
+    sheet_versions[key] = sheet_versions.get(key, 0) + 1 # Downloads started before this write are stale
+    entry = sheet_cache.get(key)
+    if not entry:
+        return
+    values = entry["values"]
+    entry.pop("table", None) # Rebuilt from the new values when needed
+    headers = [header.strip() for header in values[1]] if len(values) > 1 else []
+    roster_cols = {i for i, header in enumerate(headers) if header in ["Name", "Platoon"]}
+    expiry = entry.get("expiry")
+    expiry_cols = {expiry.date_col, expiry.status_col} if expiry else set()
+    touched_rows = set() # Rows whose date or status changed, moved in the expiry calendar
+    try:
+        for update in updates:
+            start_row, start_col = gspread.utils.a1_to_rowcol(update["range"].split(":")[0])
+            for r, row_values in enumerate(update["values"]):
+                row_index = start_row - 1 + r
+                while len(values) <= row_index: # Extend grid if the write goes past the last row
+                    values.append([])
+                row = values[row_index]
+                for c, value in enumerate(row_values):
+                    col_index = start_col - 1 + c
+                    if len(row) <= col_index:
+                        row.extend([""] * (col_index + 1 - len(row)))
+                    row[col_index] = "" if value is None else str(value)
+                    if row_index < 2 or col_index in roster_cols: # Names changed, rebuild name index
+                        entry.pop("indexes", None)
+                        entry.pop("expiry", None)
+                    elif col_index in expiry_cols:
+                        touched_rows.add(row_index - 2)
+        if "expiry" in entry:
+            for i in touched_rows:
+                expiry.update(values, i)
+    except Exception as e: # Unknown range format, safer to download again
+        print(f"⚠️ Could not apply updates to cached '{sheet_name}' sheet, invalidating: {e}")
+        invalidate_sheet_cache(spreadsheet, sheet_name)
+
+async def batch_update_sheet(spreadsheet, sheet_name, updates):
+    try:
+        await run_sheets(write_sheet_updates, spreadsheet, sheet_name, updates)
+    except Exception:
+        invalidate_sheet_cache(spreadsheet, sheet_name) # Sheet may be partially updated
+        raise
+    apply_updates_to_cache(spreadsheet, sheet_name, updates)
+
+def drop_unchanged_cells(spreadsheet, sheet_name, cells):
+    # Compares single cells with a fresh cached snapshot, anything else is kept
+    entry = sheet_cache.get((spreadsheet.id, sheet_name))
+    if not entry or time.monotonic() - entry["time"] >= SHEET_CACHE_TTL:
+        return cells
+    values, changed = entry["values"], {}
+    for cell, cell_values in cells.items():
+        try:
+            if len(cell_values) == 1 and len(cell_values[0]) == 1 and ":" not in cell:
+                row, col = gspread.utils.a1_to_rowcol(cell)
+                current = values[row - 1][col - 1] if row <= len(values) and col <= len(values[row - 1]) else ""
+                value = cell_values[0][0]
+                if current == ("" if value is None else str(value)):
+                    continue
+        except Exception: # Unknown range format, send it
+            pass
+        changed[cell] = cell_values
+    skipped = len(cells) - len(changed)
+    if skipped:
+        sheets_skipped_cells.inc(sheet_name, amount=skipped)
+        print(f"⏭️ {skipped} of {len(cells)} cells in '{sheet_name}' sheet already up to date.")
+    return changed
+
+# Write planner (Every cell change of a confirmation or a check, one values:batchUpdate per spreadsheet)
+def sheet_range(sheet_name, cell):
+    return "'{}'!{}".format(sheet_name.replace("'", "''"), cell)
+
+class WritePlan:
+    __slots__ = ("spreadsheets", "sheets")
+
+    def __init__(self):
+        self.spreadsheets = {} # Spreadsheet id -> spreadsheet
+        self.sheets = {} # (spreadsheet id, worksheet title) -> {cell: values}, later changes to a cell win
+
+    def add(self, spreadsheet, sheet_name, updates):
+        self.spreadsheets[spreadsheet.id] = spreadsheet
+        cells = self.sheets.setdefault((spreadsheet.id, sheet_name), {})
+        for update in updates:
+            cells.pop(update["range"], None) # Keep the order of the latest change
+            cells[update["range"]] = update["values"]
+
+    def __len__(self):
+        return sum(len(cells) for cells in self.sheets.values())
+
+    def planned(self, spreadsheet, sheet_name, cell, default=None):
+        # Value queued for a single cell, default if nothing is queued
+        values = self.sheets.get((spreadsheet.id, sheet_name), {}).get(cell)
+        return values[0][0] if values else default
+
+    async def flush(self):
+        # Returns (success, failed ranges), spreadsheets are written at the same time
+        results = await asyncio.gather(*(self._flush_spreadsheet(spreadsheet) for spreadsheet in self.spreadsheets.values()))
+        self.spreadsheets, self.sheets = {}, {}
+        failures = [failure for result in results for failure in result]
+        return not failures, failures
+
+    async def _flush_spreadsheet(self, spreadsheet):
+        # Cells that already hold the planned value are not sent
+        for key in self.sheets:
+            if key[0] == spreadsheet.id:
+                self.sheets[key] = drop_unchanged_cells(spreadsheet, key[1], self.sheets[key])
+        keys = [key for key in self.sheets if key[0] == spreadsheet.id and self.sheets[key]]
+        data, targets = [], []
+        for key in keys:
+            for cell, values in self.sheets[key].items():
+                data.append({"range": sheet_range(key[1], cell), "values": values})
+                targets.append((key[1], cell))
+        if not data:
+            return []
+
+        try:
+            response = await run_sheets(sheets_call, "write", spreadsheet.values_batch_update, {"valueInputOption": "RAW", "data": data}, targets=[key[1] for key in keys])
+        except Exception as e:
+            # Whole request rejected, write sheet by sheet so one bad tab doesn't block the rest
+            print(f"⚠️ Error during batch update of '{spreadsheet.title}': {e}\n🔄 Writing sheet by sheet...")
+            await run_sheets(forget_worksheets, spreadsheet) # Tabs may have been renamed
+            failures = []
+            for key in keys:
+                updates = [{"range": cell, "values": values} for cell, values in self.sheets[key].items()]
+                try:
+                    await batch_update_sheet(spreadsheet, key[1], updates)
+                    print(f"✅ Successfully updated '{key[1]}' sheet.")
+                except Exception as e:
+                    failures.extend(f"{sheet_range(key[1], update['range'])}: {e}" for update in updates)
+            return failures
+
+        # Every range gets a response in order, missing ones were not confirmed
+        confirmed = len(response.get("responses", [])) if isinstance(response, dict) else len(data)
+        failures = [f"{sheet_range(sheet_name, cell)}: not confirmed by Google Sheets" for sheet_name, cell in targets[confirmed:]]
+        for key in keys:
+            updates = [{"range": cell, "values": values} for cell, values in self.sheets[key].items()]
+            if any(sheet_name == key[1] for sheet_name, _ in targets[confirmed:]):
+                invalidate_sheet_cache(spreadsheet, key[1]) # Unsure what was written, read again next time
+            else:
+                apply_updates_to_cache(spreadsheet, key[1], updates)
+        print(f"✅ Successfully updated {len(keys)} sheets of '{spreadsheet.title}' with {confirmed} cells in one request.")
+        return failures
+
 # Step 7: Update Google Sheets for each sheet
-async def update_sheet(status, location, names, date_text, reason, sheets_to_update, chat_id):
+async def update_sheet(status, location, names, date_text, reason, sheets_to_update, chat_id, plan=None):
     success, message = True, ""
+    own_plan = plan is None # Without a shared plan, write this call's changes at the end
+    if own_plan:
+        plan = WritePlan()
 
     for sheet_name in sheets_to_update:
-        worksheet = sheet.worksheet(sheet_name)
-        data = worksheet.get_all_values()
+        data = await get_sheet_values(sheet, sheet_name)
         headers = data[1]  # Use second row as headers
-        df = pd.DataFrame(data[2:], columns=headers)  # Data starts from the third row
+        name_index = await get_name_index(sheet, sheet_name, official=True)
         print(f"Accessing sheet: '{sheet_name}'")
 
         # Normalize headers by stripping leading/trailing whitespace
@@ -863,7 +2052,7 @@ async def update_sheet(status, location, names, date_text, reason, sheets_to_upd
 
         # Update each person's status
         for name in names:
-            row_index = find_name_index(df, name, sheet_name, official=True)
+            row_index = await resolve_name(sheet, sheet_name, name, official=True)
             if row_index == None:
                 message += f"⚠️ No valid matches found for '{name}' in '{sheet_name}' sheet.\n"
                 continue
@@ -878,20 +2067,30 @@ async def update_sheet(status, location, names, date_text, reason, sheets_to_upd
 
             # for cell, value in updates:
             #     worksheet.update(range_name=cell, values=value)
-            msg = f"⌛ '{status}' -> {name} | {sheet_name} sheet | Name: {df['Name'][row_index-3]}"
+            msg = f"⌛ '{status}' -> {name} | {sheet_name} sheet | Name: {name_index.name_at(row_index)}"
             print(msg)
             message += f"{msg}\n"
 
         # Batch update if any
         if updates:
-            try:
-                worksheet.batch_update(updates)
-                print(f"✅ Successfully updated {sheet_name} sheet.")
-            except Exception as e:
-                success = False
-                msg = f"⚠️ Error during batch update in {sheet_name}: {e}\n⚠️ Retrying update..."
-                print(msg)
-                message += f"{msg}\n"
+            plan.add(sheet, sheet_name, updates)
+
+    success, message = await finish_plan(plan, own_plan, success, message)
+    await send_telegram_message(message, chat_id=chat_id)
+    return success
+
+async def finish_plan(plan, own_plan, success, message):
+    if own_plan:
+        written, failures = await plan.flush()
+        for failure in failures:
+            msg = f"⚠️ Error during batch update: {failure}"
+            print(msg)
+            message += f"{msg}\n"
+        success = success and written
+    elif success:
+        msg = "📝 Updates queued with the other sheets..."
+        print(msg)
+        return success, message + f"{msg}\n"
 
     if success:
         msg = "✅ All updates completed!"
@@ -899,17 +2098,18 @@ async def update_sheet(status, location, names, date_text, reason, sheets_to_upd
         msg = "⚠️ Error: Check logs for issue..."
     print(msg)
     message += f"{msg}\n"
-    await send_telegram_message(message, chat_id=chat_id)
-    return success
+    return success, message
 
-async def update_informal_sheet(informal_status, names, date_text, informal_sheets_to_update, chat_id):
+async def update_informal_sheet(informal_status, names, date_text, informal_sheets_to_update, chat_id, plan=None):
     success, message = True, ""
+    own_plan = plan is None # Without a shared plan, write this call's changes at the end
+    if own_plan:
+        plan = WritePlan()
 
     for sheet_name in informal_sheets_to_update:
-        worksheet = informal_sheet.worksheet(sheet_name)
-        data = worksheet.get_all_values()
+        data = await get_sheet_values(informal_sheet, sheet_name)
         headers = data[1]  # Use second row as headers
-        df = pd.DataFrame(data[2:], columns=headers)  # Data starts from the third row
+        name_index = await get_name_index(informal_sheet, sheet_name, official=False)
         print(f"🔎 Accessing sheet: '{sheet_name}'")
 
         # Normalize headers by stripping leading/trailing whitespace
@@ -933,7 +2133,7 @@ async def update_informal_sheet(informal_status, names, date_text, informal_shee
 
         # Update each person's record
         for name in names:
-            row_index = find_name_index(df, name, sheet_name, official=False)
+            row_index = await resolve_name(informal_sheet, sheet_name, name, official=False)
             if row_index == None:
                 message += f"⚠️ No valid matches found for '{name}' in '{sheet_name}' sheet.\n"
                 continue
@@ -942,7 +2142,8 @@ async def update_informal_sheet(informal_status, names, date_text, informal_shee
             days = extract_days(date_text)
             # Iterate through the days and add updates for each day
             for day in days:
-                tdy = datetime(datetime.now().year, datetime.now().month, int(day))
+                now = singapore_now()
+                tdy = datetime(now.year, now.month, int(day))
                 weekday = tdy.weekday()  # Monday = 0, Sunday = 6
 
                 if weekday == 5 or weekday == 6:  # Saturday or Sunday
@@ -970,64 +2171,174 @@ async def update_informal_sheet(informal_status, names, date_text, informal_shee
                 updates.extend([
                     {"range": f"{date_col}{row_index}", "values": [[informal_status]]},
                 ])
-            msg = f"⌛ '{informal_status}' -> {name} | {sheet_name} sheet | Name: {df['Name'][row_index-3]}"
+            msg = f"⌛ '{informal_status}' -> {name} | {sheet_name} sheet | Name: {name_index.name_at(row_index)}"
             print(msg)
             message += f"{msg}\n"
 
         # Batch update if any
         if updates:
-            try:
-                worksheet.batch_update(updates)
-                print(f"✅ Successfully updated '{sheet_name}' sheet.")
-            except Exception as e:
-                success = False
-                msg = f"⚠️ Error during batch update in '{sheet_name}': {e}\n⚠️ Retrying update..."
-                print(msg)
-                message += f"{msg}\n"
-                await asyncio.sleep(2)
-                worksheet.batch_update(updates) # Retry once
+            plan.add(informal_sheet, sheet_name, updates)
 
-    if success:
-        msg = "✅ All updates completed!"
-        print(msg)
-        message += f"{msg}\n"
-    else:
-        msg = "⚠️ Error: Check logs for issue..."
-        print(msg)
-        message += f"{msg}\n"
+    success, message = await finish_plan(plan, own_plan, success, message)
     await send_telegram_message(message, chat_id=chat_id)
     return success
 
+# Status history journal (Append-only SQLite file, the Google "Status" sheet is a mirrored view of it)
+STATUS_JOURNAL_PATH = os.getenv("Status_Journal_Path", "status_history.db")
+HISTORY_HEADERS = ["Ongoing Statuses", "Information"]
+
+def parse_date_range(date_text):
+    # "DD/MM/YY (AM) - DD/MM/YY (PM)" -> (start date, end date), None if invalid
+    date_parts = date_text.replace("(AM)", "").replace("(PM)", "").strip().split("-")
+    try:
+        start_date = datetime.strptime(date_parts[0].strip(), "%d/%m/%y").date()
+        end_date = datetime.strptime(date_parts[-1].strip(), "%d/%m/%y").date()
+    except ValueError:
+        return None
+    return start_date, end_date
+
+class StatusJournal:
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None) # Autocommit
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date_text TEXT NOT NULL,
+                information TEXT NOT NULL,
+                start_date TEXT,
+                end_date TEXT,
+                created_at TEXT NOT NULL,
+                removed_at TEXT
+            );
+            CREATE INDEX IF NOT EXISTS history_live_dates ON history (end_date, start_date) WHERE removed_at IS NULL;
+        """)
+
+    def append(self, date_text, information):
+        dates = parse_date_range(date_text)
+        start_date, end_date = (dates[0].isoformat(), dates[1].isoformat()) if dates else (None, None)
+        cursor = self.connection.execute(
+            "INSERT INTO history (date_text, information, start_date, end_date, created_at) VALUES (?, ?, ?, ?, ?)",
+            (date_text, information, start_date, end_date, datetime.now(ZoneInfo("UTC")).isoformat()))
+        return cursor.lastrowid
+
+    def import_rows(self, rows):
+        # Rows from the history sheet are newest first, store oldest first so ids stay in order
+        for date_text, information in reversed(rows):
+            self.append(date_text, information)
+
+    def is_empty(self):
+        return self.connection.execute("SELECT 1 FROM history LIMIT 1").fetchone() is None
+
+    def remove_latest(self):
+        row = self.connection.execute("SELECT id, date_text FROM history WHERE removed_at IS NULL ORDER BY id DESC LIMIT 1").fetchone()
+        if row:
+            self.connection.execute("UPDATE history SET removed_at = ? WHERE id = ?", (datetime.now(ZoneInfo("UTC")).isoformat(), row[0]))
+        return row
+
+    def expire(self, day):
+        # Statuses that ended before day, returns how many were removed
+        cursor = self.connection.execute(
+            "UPDATE history SET removed_at = ? WHERE removed_at IS NULL AND end_date < ?",
+            (datetime.now(ZoneInfo("UTC")).isoformat(), day.isoformat()))
+        return cursor.rowcount
+
+    def ongoing(self, day):
+        # (id, date_text, information) of statuses covering day, newest first
+        return self.connection.execute(
+            "SELECT id, date_text, information FROM history WHERE removed_at IS NULL AND start_date <= ? AND end_date >= ? ORDER BY id DESC",
+            (day.isoformat(), day.isoformat())).fetchall()
+
+    def live_rows(self):
+        return self.connection.execute("SELECT date_text, information FROM history WHERE removed_at IS NULL ORDER BY id DESC").fetchall()
+
+journal = None
+journal_lock = asyncio.Lock()
+history_mirror = {"task": None, "dirty": False, "rows": 0} # Rows currently on the history sheet
+
+async def get_journal():
+    global journal
+    async with journal_lock:
+        if journal is None:
+            new_journal = StatusJournal(STATUS_JOURNAL_PATH)
+            # Local disk may be wiped on redeploys, the mirrored "Status" sheet keeps a copy
+            datasheet = await run_sheets(get_worksheet, data_sheet, "Status")
+            data = await run_sheets(sheets_call, "read", datasheet.get_all_values)
+            history_mirror["rows"] = max(len(data) - 1, 0)
+            if new_journal.is_empty() and len(data) > 1:
+                rows = [(row[0], row[1]) for row in data[1:] if len(row) > 1 and row[0]]
+                new_journal.import_rows(rows)
+                print(f"📋 Imported {len(rows)} statuses from the history sheet.")
+            journal = new_journal
+    return journal
+
+def schedule_history_mirror():
+    history_mirror["dirty"] = True
+    task = history_mirror["task"]
+    if task is None or task.done():
+        history_mirror["task"] = asyncio.create_task(mirror_history())
+
+@track_flow("history_mirror")
+async def mirror_history():
+    # Rewrite the history sheet from the journal in one request, changes made meanwhile are picked up by the next loop
+    attempt = 0
+    while history_mirror["dirty"]:
+        history_mirror["dirty"] = False
+        rows = [list(row) for row in journal.live_rows()]
+        try:
+            await run_sheets(write_history_mirror, rows, history_mirror["rows"])
+            history_mirror["rows"] = len(rows)
+            attempt = 0
+            print(f"✅ History sheet mirrored ({len(rows)} statuses).")
+        except Exception as e:
+            # The sheet is the only copy that survives a redeploy, keep trying until it is written
+            history_mirror["dirty"] = True
+            delay = min(SHEETS_BACKOFF_CAP, SHEETS_BACKOFF_BASE * 2 ** attempt)
+            attempt += 1
+            print(f"⚠️ Error mirroring history sheet, retry {attempt} in {delay}s: {e}")
+            await asyncio.sleep(delay)
+
+async def flush_history_mirror(timeout=30):
+    # Wait for a pending mirror, used on shutdown
+    task = history_mirror["task"]
+    if task is not None and not task.done():
+        try:
+            await asyncio.wait_for(task, timeout=timeout)
+        except asyncio.TimeoutError:
+            print("⚠️ History sheet not mirrored before shutdown, the local journal has the latest statuses.")
+
+def write_history_mirror(rows, previous_rows):
+    datasheet = get_worksheet(data_sheet, "Status")
+    # Blank out rows left over from a longer history
+    values = [HISTORY_HEADERS] + rows + [["", ""]] * max(previous_rows - len(rows), 0)
+    if datasheet.row_count < len(values):
+        # Resize to an absolute row count, a retried add_rows after a timeout could add the rows twice
+        sheets_call("write", datasheet.resize, rows=len(values))
+    sheets_call("write", datasheet.batch_update, [{"range": f"A1:B{len(values)}", "values": values}])
+
 async def update_data_sheet(status, informal_status, names, all_flag, date_text, location, reason, sheets_to_update, informal_sheets_to_update):
     success = True
-
-    # Connect to the data sheet
-    datasheet = data_sheet.worksheet("Status")
-    data = datasheet.get_all_values()
-    headers = data[0]
-    df = pd.DataFrame(data[1:], columns=headers)
-    # print(df)
-    
     variables = [date_text, [status, informal_status, names, all_flag, date_text, location, reason, sheets_to_update, informal_sheets_to_update]]
 
-    # Update data sheet
+    # Append to the journal, the history sheet is updated in the background
     try:
-        datasheet.insert_rows([[clean_value(value) for value in variables]], row=2) # Adds new info at the top
+        status_journal = await get_journal()
+        status_journal.append(*[clean_value(value) for value in variables])
+        schedule_history_mirror()
     except Exception as e:
         success = False
-        print("⚠️ Error, status history update failed...")
+        print(f"⚠️ Error, status history update failed: {e}")
 
     return success
 
 # Step 8: Check for expired status
+@track_flow("status_check")
 async def check_and_update_status():
     sheets = ["AM", "PM", "NIGHT"]
-    stay_in_ppl = {"Ong Jun Wei", "Thong Wai Hung", 
-                   "Lim Jia Hao", "Alfred Leandro Liang", 
-                   "Haziq Syahmi Bin Norzaim", "Huang Shifeng"}
+    stay_in_ppl = set(STAY_IN_PEOPLE)
 
     # Get current time in Singapore
-    timezone = datetime.now(ZoneInfo("UTC")).astimezone(ZoneInfo("Asia/Singapore"))
+    timezone = singapore_now()
     hour = timezone.hour
     # print(hour) # Debugging
     tomorrow = timezone
@@ -1053,27 +2364,38 @@ async def check_and_update_status():
     print(f"Checking statuses for {tmr}...")
     message += f"Checking statuses for {tmr}...\n"
 
+    snapshots = await get_sheet_snapshots(sheet, sheets) # All sheets in one round-trip
+    expiry_calendars = get_expiry_calendars(sheet, snapshots) # Dates of every sheet parsed together
+    plan = WritePlan()
     for sheet_name in sheets:
         msg = f"🔎 Accessing worksheet: '{sheet_name}'"
         print(msg)
         message += f"{msg}\n"
         names, stay_in_names = [], []
-        worksheet = sheet.worksheet(sheet_name)
-        data = worksheet.get_all_values()
-        headers = data[1]  # Use second row as headers
-        df = pd.DataFrame(data[2:], columns=headers)  # Data starts from the third row
+        if sheet_name not in snapshots:
+            continue
+        table = get_roster_table(sheet, sheet_name, snapshots[sheet_name])
+        try:
+            name_col, status_col, date_col = table.columns["Name"], table.columns["Status"], table.columns["Date"]
+        except KeyError:
+            print(f"⚠️ Error: Required columns missing in {sheet_name} sheet.")
+            continue
 
-        # Find the first occurrence of AE
-        first_ae_index = df[df["Platoon"] == "AE"].index.min()
+        # AE platoon rows
+        ae_rows = table.block("Platoon", "AE")
         status = "PRESENT" if sheet_name != "NIGHT" else "P - STAY OUT"
-        if pd.isna(first_ae_index):  # If no AE platoon members found
+        if not ae_rows:  # If no AE platoon members found
             print(f"⚠️ No AE platoon members found in {sheet_name} sheet.")
             continue
 
-        for i, row in df.iloc[first_ae_index:].iterrows():
-            platoon, name, date_range, current_status = row["Platoon"], row["Name"], row["Date"].strip(), row["Status"]
-            if platoon != "AE": # Stops when no longer AE ppl
-                break
+        # Only rows that can change: ending by tomorrow, staying in, unreadable dates and the stay in people
+        expiry = expiry_calendars[sheet_name]
+        candidates = expiry.due(tomorrow.date()) | expiry.stay_in | expiry.invalid | expiry.rows_of(stay_in_ppl)
+        print(f"📅 {len(candidates)} of {len(ae_rows)} AE rows to check in {sheet_name} sheet.")
+
+        for i in sorted(candidates):
+            name, current_status, raw_date = table.get(i, name_col), table.get(i, status_col), table.get(i, date_col)
+            date_range = raw_date.strip()
             if not date_range: # For ppl with no date
                 # All stay in to stay out (For stay out ppl)
                 if name not in stay_in_ppl and current_status == "P - STAY IN SGC 377":
@@ -1085,42 +2407,24 @@ async def check_and_update_status():
                     continue
 
                 print(f"🚨 Expired: {name}")
-                message += (f"🚨 Expired: {sheet_name} | Name: {name} | Status: {row['Status']} | Dates: {row['Date']}\n")
+                message += (f"🚨 Expired: {sheet_name} | Name: {name} | Status: {current_status} | Dates: {raw_date}\n")
                 continue
 
             # Formate date for comparison
-            date_parts = date_range.replace("(AM)", "").replace("(PM)", "").strip()
-            # print(date_range)
             try:
-                date_range = date_range.split("-") # With AM/PM
-                date_parts = date_parts.split("-")
-                if len(date_parts) > 1:
-                    end_date = datetime.strptime(date_parts[-1].strip(), "%d/%m/%y")
-                    period = date_range[-1].upper()
-                else:
-                    end_date = datetime.strptime(date_parts[0].strip(), "%d/%m/%y")
-                    period = date_range[0].upper()
-                if "(AM)" in period:
-                    period = "AM"
-                elif "(PM)" in period:
-                    period = "PM"
-                else:
-                    period = None
-                    
-                # end_date = datetime.strptime(date_parts[-1].strip(), "%d/%m/%y") if len(date_parts) > 1 else datetime.strptime(date_parts[0].strip(), "%d/%m/%y")
-                # print(end_date) # Debugging and alternate code?^^
+                end_date, period = parse_end_date(date_range)
 
                 # Compare end_date to tomorrows's date
-                if end_date.date() <= tomorrow.date():
+                if end_date <= tomorrow.date():
                     # Check if same day, status expires at some period
-                    if end_date.date() == tomorrow.date(): 
+                    if end_date == tomorrow.date(): 
                         print("🔄 Same day, checking period...")
                         if (period == sheet_name) or (period == "PM" and sheet_name == "AM") or (period == None):
                             print(f"⏭️ Status not expired in {period} for {sheet_name} sheet,skipping...")
                             continue
                 
                     print(f"🚨 Expired: {name}")
-                    message += (f"🚨 Expired: {sheet_name} | Name: {name} | Status: {row['Status']} | Dates: {row['Date']}\n")
+                    message += (f"🚨 Expired: {sheet_name} | Name: {name} | Status: {current_status} | Dates: {raw_date}\n")
                     if name in stay_in_ppl:
                         stay_in_names.append(name)
                     else:
@@ -1129,27 +2433,35 @@ async def check_and_update_status():
                 print(f"⚠️ Invalid date format for {name}: '{date_range}'")
                 continue
         # message += "\n" (Trying to merge all messages)
-        await send_telegram_message(message, chat_id=chat_id)
+        await send_telegram_message(message, chat_id=current_chat_id.get())
         message = ""
 
         # Update each sheet in batches
         # Combine name list for one batch update
         names += stay_in_names
         if names:
-            await update_sheet(status, "", names, "", "", [sheet_name], chat_id)
-    # Changes stay out to stay in for those needed
+            await update_sheet(status, "", names, "", "", [sheet_name], current_chat_id.get(), plan=plan)
+    # Changes stay out to stay in for those needed (Later change to the same cell wins)
     if stay_in_names:
-        await update_sheet("P - STAY IN SGC 377", "", stay_in_names, "", "", ["NIGHT"], chat_id)
+        await update_sheet("P - STAY IN SGC 377", "", stay_in_names, "", "", ["NIGHT"], current_chat_id.get(), plan=plan)
+
+    # Write every sheet in one request
+    written, failures = await plan.flush()
+    for failure in failures:
+        msg = f"⚠️ Error during batch update: {failure}"
+        print(msg)
+        message += f"{msg}\n"
 
-    msg = f"📅 Next run scheduled at: {scheduler.get_jobs()[0].next_run_time.strftime('%d/%m/%y %H:%M:%S')}"
+    msg = f"📅 Next run scheduled at: {scheduler.get_job('daily_check').next_run_time.strftime('%d/%m/%y %H:%M:%S')}"
     print(msg) # Debugging
     message += msg
-    await send_telegram_message(message, chat_id=chat_id)
+    await send_telegram_message(message, chat_id=current_chat_id.get())
     return "✅ Status check complete!"
 
+@track_flow("informal_check")
 async def check_and_update_informal_status():
     # Get current time in Singapore
-    timezone = datetime.now(ZoneInfo("UTC")).astimezone(ZoneInfo("Asia/Singapore"))
+    timezone = singapore_now()
     hour = timezone.hour
     # print(hour) # Debugging
     tomorrow = timezone
@@ -1172,221 +2484,216 @@ async def check_and_update_informal_status():
     print(f"Checking statuses for {tmr}...")
     message += f"Checking statuses for {tmr}...\n"
 
+    snapshots = await get_sheet_snapshots(informal_sheet, informal_sheets) # Both sheets in one round-trip
+    plan = WritePlan()
     for sheet_name in informal_sheets:
         msg = f"🔎 Accessing worksheet: '{sheet_name}'"
         print(msg)
         message += f"{msg}\n"
-        names, default_status = [], 1
-        worksheet = informal_sheet.worksheet(sheet_name)
-        data = worksheet.get_all_values()
-        headers = data[1]  # Use second row as headers
-        df = pd.DataFrame(data[2:], columns=headers)  # Data starts from the third row
+        updates, default_status = [], 1
+        if sheet_name not in snapshots:
+            continue
+        table = get_roster_table(informal_sheet, sheet_name, snapshots[sheet_name])
 
         # Get the indexes of S/N columns
-        second_name_batch = df[df["S/N"] == "S/N"].index.min()
+        second_name_batch = table.find("S/N", "S/N")
         # print(f"✅ Second occurrence of 'S/N' is at index {second_name_batch}")
-        if second_name_batch is None or pd.isna(second_name_batch):
+        if second_name_batch is None:
             print(f"⚠️ No batch found in {sheet_name} sheet.")
             continue
-        
-        for i, row in df.iloc[second_name_batch:].iterrows():
-            sn, name = row["S/N"].strip(), row["Name"].strip()
+        if day not in table.columns or "Name" not in table.columns:
+            print(f"⚠️ Error: Column for day '{day}' not found in {sheet_name} sheet.")
+            continue
+        sn_col, name_col = table.columns["S/N"], table.columns["Name"]
+
+        # Every weekday of the month up to tomorrow, so days missed while the bot was down are filled too
+        day_cols = [table.columns[str(d)] for d in range(1, tomorrow.day + 1) if str(d) in table.columns and date(tomorrow.year, tomorrow.month, d).weekday() < 5]
+
+        # One pass over the names x days grid
+        for i in range(second_name_batch, len(table)):
+            sn, name = table.get(i, sn_col).strip(), table.get(i, name_col).strip()
             # print(f"S/N: {sn} | Name: {name}") # Debugging
             # Skip if sn is not a digit
             if not sn.isdigit():
                 continue
             # Check if current status is empty
-            if not row[day].strip():
-                names.append(name)
-                msg = f"🚨 Empty: {name}"
-                print(msg)
-                message += f"{msg}\n"
+            empty_cols = [col for col in day_cols if not table.get(i, col).strip()]
+            if not empty_cols:
+                continue
+            msg = f"🚨 Empty: {name} (Day {', '.join(table.headers[col] for col in empty_cols)})"
+            print(msg)
+            message += f"{msg}\n"
+            # Neighbouring days go in one range
+            for start, stop in column_spans(empty_cols):
+                cell = f"{get_column_letter(start)}{i + 3}" # Adjusting for header rows
+                if stop > start:
+                    cell += f":{get_column_letter(stop)}{i + 3}"
+                updates.append({"range": cell, "values": [[default_status] * (stop - start + 1)]})
         # message += "\n" (Trying to merge all messages)
-        await send_telegram_message(message, chat_id=chat_id)
+        await send_telegram_message(message, chat_id=current_chat_id.get())
         message = ""
         
         # Update each sheet in batches
-        if names:
-            print(f"📝 Updating '{sheet_name}' for names: {names} with status: {default_status}")
-            await update_informal_sheet(default_status, names, tmr, [sheet_name], chat_id)
+        if updates:
+            print(f"📝 Updating '{sheet_name}' with {len(updates)} ranges with status: {default_status}")
+            plan.add(informal_sheet, sheet_name, updates)
 
-    msg = f"📅 Next run scheduled at: {scheduler.get_jobs()[0].next_run_time.strftime('%d/%m/%y %H:%M:%S')}"
+    # Write both sheets in one request
+    written, failures = await plan.flush()
+    for failure in failures:
+        msg = f"⚠️ Error during batch update: {failure}"
+        print(msg)
+        message += f"{msg}\n"
+
+    msg = f"📅 Next run scheduled at: {scheduler.get_job('daily_check').next_run_time.strftime('%d/%m/%y %H:%M:%S')}"
     print(msg) # Debugging
     message += msg
-    await send_telegram_message(message, chat_id=chat_id)
+    await send_telegram_message(message, chat_id=current_chat_id.get())
     return "✅ Status check complete!"
 
 # Check and collect expired / ongoing statuses
+@track_flow("history_check")
 async def check_and_update_data_sheet():
     success = True
 
     # Get current time in Singapore
-    timezone = datetime.now(ZoneInfo("UTC")).astimezone(ZoneInfo("Asia/Singapore"))
+    timezone = singapore_now()
     hour = timezone.hour
     # print(hour) # Debugging
     tomorrow = timezone
     if hour >= 20:
         tomorrow += timedelta(days=1)
 
-    # Connect to the data sheet
-    datasheet = data_sheet.worksheet("Status")
-
     # Define sheet structure
     sheets_to_update = ["AM", "PM", "NIGHT"]
-    informal_sheet_name = timezone.strftime("%b %y")
+    informal_sheet_name = tomorrow.strftime("%b %y")
     informal_sheets_to_update = [f"{informal_sheet_name} (AM)", f"{informal_sheet_name} (PM)"]
     sheet_structure = {
         sheet: sheets_to_update,
         informal_sheet: informal_sheets_to_update
     }
-    updates_by_sheet = {
-        "AM": [],
-        "PM": [],
-        "NIGHT": [],
-        f"{informal_sheet_name} (AM)": [],
-        f"{informal_sheet_name} (PM)": []
-    }
+    day = str(int(tomorrow.strftime("%d"))) # Convert "01" to "1" etc
 
-    # Read all rows
-    history = datasheet.get_all_records()
-    expired_rows, ongoing_rows = [], []
+    # Load every target worksheet once, all history rows are resolved against these snapshots
+    # One batch read per spreadsheet, both spreadsheets at the same time
+    snapshots = {}
+    results = await asyncio.gather(*(get_sheet_snapshots(excel_file, sheet_names) for excel_file, sheet_names in sheet_structure.items()))
+    for excel_file, sheet_values in zip(sheet_structure, results):
+        for sheet_name, data in sheet_values.items():
+            snapshots[sheet_name] = get_roster_table(excel_file, sheet_name, data)
+    if len(snapshots) < len(sheets_to_update) + len(informal_sheets_to_update):
+        success = False # Missing sheets were skipped
+    # Planned cell values per sheet, range -> value (History is newest first so the first plan for a cell wins)
+    planned_by_sheet = {sheet_name: {} for sheet_name in snapshots}
+
+    # Expired statuses are removed from the journal, ongoing ones come back newest first
+    status_journal = await get_journal()
+    expired = status_journal.expire(tomorrow.date())
+    if expired:
+        print(f"🚨 Expired: {expired} statuses removed from history.")
+    ongoing_rows = []
+
+    for i, status_date, information in status_journal.ongoing(tomorrow.date()):
+        # Status is shown as present even though there should be a status
+        # Log the updates needed in a batch and push at the end
+        try:
+            variables = json.loads(information)
+        except json.JSONDecodeError:
+            print(f"⚠️ Unreadable history information in entry {i}, skipping...")
+            continue
+        status, informal_status, names, date_text, location, reason = variables[0], variables[1], variables[2], variables[4], variables[5], variables[6]
+        # All-Flag entries hold the names resolved on confirmation, so they are reconciled like any other
+        if isinstance(names, str):
+            names = [names]
+        # Only the sheets the status was sent for (Informal tabs by period, the stored month may have passed)
+        formal_targets, informal_targets = sheets_to_update, informal_sheets_to_update
+        if len(variables) > 8:
+            formal_targets = [sheet_name for sheet_name in sheets_to_update if sheet_name in variables[7]]
+            informal_targets = [sheet_name for sheet_name in informal_sheets_to_update if any(sheet_name[-4:] == target[-4:] for target in variables[8])]
+        # print(f"⌛ Ongoing: {status_date}")
 
-    # Check for expired statuses
-    for i, row in enumerate(history, start = 2): # Iterate through history row by row with index i
-        # Get date of status
-        status_date = row["Ongoing Statuses"] # Header of column
+        for name in names:
+            print(f"Trying to find name: {name}...")
 
-        # Formate date for comparison
-        date_parts = status_date.replace("(AM)", "").replace("(PM)", "").strip()
-        # print(status_date)
-        try:
-            date_range = status_date.split("-") # With AM/PM
-            date_parts = date_parts.split("-")
-            if len(date_parts) > 1:
-                start_date = datetime.strptime(date_parts[0].strip(), "%d/%m/%y")
-                end_date = datetime.strptime(date_parts[-1].strip(), "%d/%m/%y")
-            else:
-                start_date = datetime.strptime(date_parts[0].strip(), "%d/%m/%y")
-                end_date = start_date
-
-            # Check for expired statuses
-            if end_date.date() < tomorrow.date():
-                print(f"🚨 Expired: {status_date}")
-                expired_rows.append(i)
-
-            # Check for ongoing statuses
-            # Should check if AM / PM / NIGHT / Informal Sheets -> Use info from history
-            # Status is shown as present even though there should be a status
-            # Log the updates needed in a batch and push at the end
-            elif end_date.date() >= tomorrow.date() and start_date.date() <= tomorrow.date():
+            # Check official sheets
+            for sheet_name in formal_targets:
+                table = snapshots.get(sheet_name)
+                if table is None:
+                    continue
+
+                # Find current status of name
+                row_index = await resolve_name(sheet, sheet_name, name, official=True)
+                if row_index == None:
+                    continue
+                # Column indexes
                 try:
-                    variables = json.loads(row["Information"]) # Header of column
-                except json.JSONDecodeError:
-                    variables = row["Information"]  # fallback to raw string
-                status, informal_status, name, date_text, location, reason = variables[0], variables[1], variables[2], variables[4], variables[5], variables[6], 
-                # print(f"⌛ Ongoing: {status_date}")
-                print(f"Trying to find name: {name}...")
-                
-                # Check official sheets
-                for sheet_name in sheets_to_update:
-                    print(f"⌛ Now processing: {sheet_name}")
-                    worksheet = sheet.worksheet(sheet_name)
-                    data = worksheet.get_all_values()
-                    headers = data[1]
-                    df = pd.DataFrame(data[2:], columns=headers)
-
-                    # Find current status of name
-                    row_index = find_name_index(df, name, sheet_name, official=True)
-                    current_row = df.iloc[row_index]
-                    current_status = current_row["Status"]
-                    print(current_status)
-
-                    # If unupdated with existing status, get update
-                    if current_status in ["PRESENT", "P - STAY OUT", "P - STAY IN SGC 377"]:
-                        # Normalize headers by stripping leading/trailing whitespace
-                        formatted_headers = [header.strip() for header in headers]
-
-                        # Column indexes
-                        try:
-                            status_col = formatted_headers.index("Status")
-                            date_col = formatted_headers.index("Date")
-                            remarks_col = formatted_headers.index("Remarks")
-                            location_col = formatted_headers.index("Location")
-                        except ValueError:
-                            success = False
-                            print(f"⚠️ Error: Required columns missing in {sheet_name} sheet.")
-                            continue
-                        
-                        # Save update info
-                        updates_by_sheet[sheet_name].extend([
-                            {"range": f"{chr(65 + status_col)}{row_index}", "values": [[status]]},
-                            {"range": f"{chr(65 + date_col)}{row_index}", "values": [[date_text]]},
-                            {"range": f"{chr(65 + remarks_col)}{row_index}", "values": [[reason]]},
-                            {"range": f"{chr(65 + location_col)}{row_index}", "values": [[location]]}
-                        ])
-
-                # Check informal sheets
-                for sheet_name in informal_sheets_to_update:
-                    print(f"⌛ Now processing: {sheet_name}") 
-                    worksheet = informal_sheet.worksheet(sheet_name)
-                    data = worksheet.get_all_values()
-                    headers = data[1]
-                    df = pd.DataFrame(data[2:], columns=headers)
-
-                    # Find current status of name
-                    row_index = find_name_index(df, name, sheet_name, official=False)
-                    day = str(int(tomorrow.strftime("%d"))) # Convert "01" to "1" etc
-                    current_row = df.iloc[row_index]
-                    current_status = current_row[day]
-
-                    if current_status in ["", "1", 1]:
-                        # Normalize headers by stripping leading/trailing whitespace
-                        formatted_headers = [header.strip() for header in headers]
-                        # Column index
-                        try:
-                            date_col = get_column_letter(formatted_headers.index(day)) # Index of day column
-                        except ValueError:
-                            success = False
-                            print(f"⚠️ Error: Column for day '{day}' not found in {sheet_name} sheet.")
-                            continue
+                    status_col = table.columns["Status"]
+                    date_col = table.columns["Date"]
+                    remarks_col = table.columns["Remarks"]
+                    location_col = table.columns["Location"]
+                except KeyError:
+                    success = False
+                    print(f"⚠️ Error: Required columns missing in {sheet_name} sheet.")
+                    continue
+                current_status = table.get(row_index - 3, status_col) # Adjusting for header rows
+
+                # If unupdated with existing status, get update
+                if current_status in ["PRESENT", "P - STAY OUT", "P - STAY IN SGC 377"]:
+                    # Save update info
+                    planned = planned_by_sheet[sheet_name]
+                    planned.setdefault(f"{chr(65 + status_col)}{row_index}", status)
+                    planned.setdefault(f"{chr(65 + date_col)}{row_index}", date_text)
+                    planned.setdefault(f"{chr(65 + remarks_col)}{row_index}", reason)
+                    planned.setdefault(f"{chr(65 + location_col)}{row_index}", location)
+
+            # Check informal sheets
+            for sheet_name in informal_targets:
+                table = snapshots.get(sheet_name)
+                if table is None:
+                    continue
 
-                        # Save update info
-                        updates_by_sheet[sheet_name].extend([
-                            {"range": f"{date_col}{row_index}", "values": [[informal_status]]}
-                        ])
+                # Find current status of name
+                row_index = await resolve_name(informal_sheet, sheet_name, name, official=False)
+                if row_index == None:
+                    continue
+                # Column index
+                try:
+                    day_col = table.columns[day] # Index of day column
+                except KeyError:
+                    success = False
+                    print(f"⚠️ Error: Column for day '{day}' not found in {sheet_name} sheet.")
+                    continue
+                current_status = table.get(row_index - 3, day_col)
 
-                ongoing_rows.append(i)
+                if current_status in ["", "1", 1]:
+                    # Save update info
+                    planned_by_sheet[sheet_name].setdefault(f"{get_column_letter(day_col)}{row_index}", informal_status)
 
-        except ValueError as e: # Skip invalid dates
-            print(f"⚠️ Invalid date format for '{date_range}', {e}")
-            continue
+        ongoing_rows.append(i)
 
     # print(f"Ongoing rows: {ongoing_rows}") # Debugging
-    # print(f"Expired rows: {expired_rows}")
 
-    # Update all sheets
+    # Update all sheets, one request per spreadsheet
+    plan = WritePlan()
     for excel_file, sheet_names in sheet_structure.items():
         for sheet_name in sheet_names:
-            worksheet = excel_file.worksheet(sheet_name)
-            updates = updates_by_sheet[sheet_name]
-            if updates:
-                try:
-                    worksheet.batch_update(updates)
-                    print(f"✅ Successfully updated {sheet_name}.")
-                except Exception as e:
-                    success = False
-                    print(f"⚠️ Error during batch update in {sheet_name}: {e}")
+            planned = planned_by_sheet.get(sheet_name)
+            if planned:
+                plan.add(excel_file, sheet_name, [{"range": cell, "values": [[value]]} for cell, value in planned.items()])
+    written, failures = await plan.flush()
+    for failure in failures:
+        success = False
+        print(f"⚠️ Error during batch update: {failure}")
 
-    # Delete all expired statuses
-    for i in reversed(expired_rows): # Start in reverse to avoid index shifts
-        datasheet.delete_rows(i)
+    # Show the expired statuses as removed on the history sheet
+    if expired:
+        schedule_history_mirror()
 
     return success
 
 async def send_reminder():
-    global chat_id
-    timezone = datetime.now(ZoneInfo("UTC"))
-    time = timezone.astimezone(ZoneInfo("Asia/Singapore"))
+    chat_id = current_chat_id.get()
+    time = singapore_now()
     day = time.weekday()
     hour = time.hour
 
@@ -1414,43 +2721,24 @@ async def send_reminder():
     await send_telegram_message(f"🔔 Reminder to update {period} status on WhatsApp~", chat_id)
     return None
 
-# Step 9: Run the checks everyday (Cannot be asnyc)
-def run_asyncio_task():
-    # Get current event loop of bot
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
+# Step 9: Run the checks everyday (On the bot's own event loop, reuses the bot's connection pool)
+async def run_daily_checks():
     # Run all check function
-    loop.run_until_complete(check_and_update_status())
-    loop.run_until_complete(check_and_update_informal_status())
-    loop.run_until_complete(check_and_update_data_sheet())
-
-def run_timed_reminders():
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    loop.run_until_complete(send_reminder())
+    await check_and_update_status()
+    await check_and_update_informal_status()
+    await check_and_update_data_sheet()
 
 # Function to start the scheduler
-scheduler = BackgroundScheduler(timezone=ZoneInfo("Asia/Singapore")) # Adjust timezone
-async def start_scheduler():
+scheduler = AsyncIOScheduler(timezone=ZoneInfo("Asia/Singapore")) # Adjust timezone
+def start_scheduler():
     print("Starting scheduler...")
     # End of day check
-    scheduler.add_job(run_asyncio_task, "cron", hour=22, minute=30, misfire_grace_time=60, coalesce=True, max_instances=1)
+    scheduler.add_job(run_daily_checks, "cron", id="daily_check", hour=22, minute=30, misfire_grace_time=60, coalesce=True, max_instances=1)
     # Update Whatsapp Reminders
-    scheduler.add_job(run_timed_reminders, "cron", hour=8, misfire_grace_time=60, coalesce=True, max_instances=1)
-    scheduler.add_job(run_timed_reminders, "cron", hour=12, misfire_grace_time=60, coalesce=True, max_instances=1)
-    scheduler.add_job(run_timed_reminders, "cron", hour=18, misfire_grace_time=60, coalesce=True, max_instances=1)
-    scheduler.start()
-
-    # Ensure job is added before accessing it
-    time.sleep(1)  # Add a small delay to ensure job registration
+    scheduler.add_job(send_reminder, "cron", hour=8, misfire_grace_time=60, coalesce=True, max_instances=1)
+    scheduler.add_job(send_reminder, "cron", hour=12, misfire_grace_time=60, coalesce=True, max_instances=1)
+    scheduler.add_job(send_reminder, "cron", hour=18, misfire_grace_time=60, coalesce=True, max_instances=1)
+    scheduler.start() # Uses the running loop, jobs get their next run time here
 
     jobs = scheduler.get_jobs()
     if jobs and jobs[0].next_run_time:
@@ -0,0 +1,278 @@
+# Benchmark every bot flow against in-memory Google Sheets and Telegram (See fake_sheets.py)
+# Usage: python benchmark.py --people 40 120 400 [--latency 0.05] [--quota-every 25] [--warm] [--json]
+# Exits non-zero if a flow goes over its Sheets request budget, downloads a sheet twice or writes a spreadsheet twice
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+import contextlib
+import argparse
+import tempfile
+import asyncio
+import json
+import sys
+import time
+import os
+
+# Settings Status.py reads at import (Quotas are opened up so only the injected errors and latency count)
+BENCHMARK_ENV = {
+    "Telegram_Token": "123456:benchmark",
+    "Chat_ID": "1",
+    "Group_Chat_ID": "-1001",
+    "Google_Sheets_Credentials": "",
+    "Sheets_Reads_Per_Minute": "100000",
+    "Sheets_Writes_Per_Minute": "100000",
+    "Sheets_Retry_Budget": "100000",
+    "Telegram_Merge_Window": "0",
+    "Telegram_Messages_Per_Minute": "100000",
+    "Status_Journal_Path": os.path.join(tempfile.mkdtemp(prefix="status-benchmark-"), "status_history.db"),
+}
+for key, value in BENCHMARK_ENV.items():
+    os.environ.setdefault(key, value)
+
+import fake_sheets
+import Status
+
+SENDER = 1000
+FORMAL_URL, INFORMAL_URL, DATA_URL = "fake://formal", "fake://informal", "fake://data"
+# Fixed weekday evening so every run checks the same day (A weekend skips the informal check and most of the status check)
+BENCHMARK_NOW = datetime(2026, 10, 14, 22, 30, tzinfo=ZoneInfo("Asia/Singapore")) # Wednesday
+
+def singapore_now():
+    return BENCHMARK_NOW
+
+def check_day():
+    # Day the nightly checks look at
+    now = singapore_now()
+    return now + timedelta(days=1) if now.hour >= 20 else now
+
+def build_backend(people, args):
+    backend = fake_sheets.FakeBackend(latency=args.latency, jitter=args.jitter, quota_every=args.quota_every, retry_after=args.retry_after)
+    names = fake_sheets.make_names(people)
+    other_rows = people // 2
+    today, day = singapore_now(), check_day()
+
+    # A tenth of the platoon expires on the checked day, another tenth is away for a week
+    statuses = {}
+    for i, name in enumerate(names):
+        if i % 10 == 1:
+            statuses[name] = ("MC", f"{(day - timedelta(days=2)).strftime('%d/%m/%y')} - {day.strftime('%d/%m/%y')}", "MC No. 123", "")
+        elif i % 10 == 2:
+            statuses[name] = ("LEAVE", f"{today.strftime('%d/%m/%y')} - {(today + timedelta(days=7)).strftime('%d/%m/%y')}", "Overseas", "")
+    backend.add_spreadsheet(FORMAL_URL, "Parade State", {
+        "AM": fake_sheets.formal_sheet(names, other_rows, statuses=statuses),
+        "PM": fake_sheets.formal_sheet(names, other_rows, statuses=statuses),
+        "NIGHT": fake_sheets.formal_sheet(names, other_rows, night=True),
+    })
+
+    # Informal tabs for this month and the checked day's month
+    informal_tabs = {}
+    for month in dict.fromkeys([today, day]):
+        month_name = month.strftime("%b %y")
+        filled = max(day.day - 1, 0) if month.month == day.month else 31
+        for period in ["AM", "PM"]:
+            informal_tabs[f"{month_name} ({period})"] = fake_sheets.informal_sheet(names, other_rows, filled_days=filled)
+    backend.add_spreadsheet(INFORMAL_URL, "Attendance", informal_tabs)
+    backend.add_spreadsheet(DATA_URL, "Status History", {"Status": [Status.HISTORY_HEADERS]})
+    return backend, names
+
+def connect(backend, bot):
+    # Point Status.py at the fakes, as connect_sheets would on startup
+    client = backend.client()
+    Status.sheet = client.open_by_url(FORMAL_URL)
+    Status.informal_sheet = client.open_by_url(INFORMAL_URL)
+    Status.data_sheet = client.open_by_url(DATA_URL)
+    Status.startup_state["sheets"] = "ready"
+    Status.sheets_connected.set()
+    Status.ptb = SimpleNamespace(bot=bot)
+    Status.singapore_now = singapore_now
+    Status.current_chat_id.set(int(Status.GROUP_CHAT_ID)) # Flows run in this context, like updates in handle_update
+    Status.journal = None
+    Status.STATUS_JOURNAL_PATH = os.path.join(tempfile.mkdtemp(prefix="status-benchmark-"), "status_history.db")
+
+def clear_caches():
+    # Cold start for the next flow
+    for cache in [Status.sheet_cache, Status.sheet_fetches, Status.worksheet_registry, Status.name_identities, Status.resolved_rows]:
+        cache.clear()
+
+def reset_counters(backend, bot):
+    backend.reset_stats()
+    bot.sent.clear()
+    bot.attempts = bot.floods = 0
+    with Status.sheets_stats_lock:
+        for counter in ["requests", "retries", "failures"]:
+            Status.sheets_stats[counter] = {}
+        Status.sheets_stats["throttled_seconds"] = 0.0
+    for counter in Status.telegram_stats:
+        Status.telegram_stats[counter] = 0
+
+def status_message(status, names, date_text):
+    return f"Status: {status}\nR/Name:\n" + "\n".join(f"PTE {name}" for name in names) + f"\nDate: {date_text}"
+
+def message_dates(days=2):
+    today = singapore_now()
+    return f"{today.strftime('%d%m%y')}-{(today + timedelta(days=days)).strftime('%d%m%y')}"
+
+async def send_and_confirm(bot, text):
+    # Runs a status message through handle_message and presses its confirm button
+    message = fake_sheets.FakeMessage(bot, Status.current_chat_id.get(), text)
+    message.from_user = SimpleNamespace(id=SENDER)
+    context = SimpleNamespace(user_data={})
+    await Status.handle_message(SimpleNamespace(message=message, effective_chat=message.chat), context)
+    pending_id = next(reversed(Status.pending_updates.entries))
+
+    async def noop(*args, **kwargs):
+        return None
+    query = SimpleNamespace(
+        data=f"confirm:{pending_id}",
+        from_user=SimpleNamespace(id=SENDER),
+        message=fake_sheets.FakeMessage(bot, Status.current_chat_id.get(), ""),
+        edit_message_reply_markup=noop,
+        answer=noop,
+    )
+    await Status.handle_confirmation(SimpleNamespace(callback_query=query, message=None, effective_chat=message.chat), context)
+
+# Flows, run in this order so the history check sees the confirmed statuses
+async def confirmation_flow(bot, names):
+    await send_and_confirm(bot, status_message("MC", names[3:6], message_dates()))
+
+async def bulk_flow(bot, names):
+    blocks = [status_message(status, names[6 + 2 * i:8 + 2 * i], message_dates(i + 1)) for i, status in enumerate(["LEAVE", "OFF", "CSE", "DUTY", "MC"])]
+    await send_and_confirm(bot, "\n".join(blocks))
+
+async def all_flag_flow(bot, names):
+    await send_and_confirm(bot, f"Status: Present\nR/Name: All\nDate: {singapore_now().strftime('%d%m%y')}")
+
+async def status_check_flow(bot, names):
+    await Status.check_and_update_status()
+
+async def informal_check_flow(bot, names):
+    await Status.check_and_update_informal_status()
+
+async def history_check_flow(bot, names):
+    await Status.check_and_update_data_sheet()
+
+FLOWS = [
+    ("confirmation", confirmation_flow),
+    ("bulk confirmation", bulk_flow),
+    ("all-flag", all_flag_flow),
+    ("status check", status_check_flow),
+    ("informal check", informal_check_flow),
+    ("history check", history_check_flow),
+]
+
+# Most Sheets requests each flow may make (Cold caches, failed attempts that were retried don't count)
+FLOW_BUDGETS = {
+    "confirmation": 10,
+    "bulk confirmation": 9,
+    "all-flag": 8,
+    "status check": 3,
+    "informal check": 3,
+    "history check": 6,
+}
+
+def check_requests(flow_name, log):
+    # Returns what a flow did wrong, any problem makes the benchmark exit non-zero
+    problems = []
+    log = [entry for entry in log if not entry[3]]
+    if len(log) > FLOW_BUDGETS[flow_name]:
+        problems.append(f"{len(log)} Sheets requests, budget is {FLOW_BUDGETS[flow_name]}")
+    batch_reads, batch_writes = {}, {}
+    for method, spreadsheet, sheets, _ in log:
+        if method == "values_batch_get":
+            for sheet_name in sheets:
+                batch_reads[(spreadsheet, sheet_name)] = batch_reads.get((spreadsheet, sheet_name), 0) + 1
+        elif method == "values_batch_update":
+            batch_writes[spreadsheet] = batch_writes.get(spreadsheet, 0) + 1
+    for (spreadsheet, sheet_name), count in batch_reads.items():
+        if count > 1:
+            problems.append(f"'{sheet_name}' batch read {count} times")
+    for method, spreadsheet, sheets, _ in log:
+        if method == "get_all_values" and (spreadsheet, sheets[0]) in batch_reads:
+            problems.append(f"'{sheets[0]}' downloaded again after a batch read")
+    for spreadsheet, count in batch_writes.items():
+        if count > 1:
+            problems.append(f"{count} batch updates of '{spreadsheet}', expected one")
+    return problems
+
+async def drain():
+    # Background work started by a flow (History mirror, queued Telegram messages)
+    task = Status.history_mirror["task"]
+    if task is not None:
+        await task
+    await Status.flush_telegram_messages(timeout=60)
+
+async def run_size(people, args):
+    backend, names = build_backend(people, args)
+    bot = fake_sheets.FakeBot(latency=args.telegram_latency, flood_every=args.flood_every)
+    connect(backend, bot)
+    quiet = open(os.devnull, "w")
+    results = []
+    for flow_name, flow in FLOWS:
+        if not args.warm:
+            clear_caches()
+        reset_counters(backend, bot)
+        with contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(quiet): # Status.py logs every step
+            start = time.perf_counter()
+            await flow(bot, names)
+            wall = time.perf_counter() - start
+            await drain()
+        sheets = backend.stats()
+        results.append({
+            "people": people,
+            "flow": flow_name,
+            "clock": BENCHMARK_NOW.strftime("%a %d/%m/%y %H:%M"),
+            "wall_ms": round(wall * 1000, 1),
+            "sheets_calls": sheets["requests"],
+            "reads": sum(count for key, count in Status.sheets_stats["requests"].items() if key.endswith(":read")),
+            "writes": sum(count for key, count in Status.sheets_stats["requests"].items() if key.endswith(":write")),
+            "retries": sum(Status.sheets_stats["retries"].values()),
+            "bytes_down": sheets["bytes_down"],
+            "bytes_up": sheets["bytes_up"],
+            "telegram_messages": bot.stats()["messages"],
+            "telegram_bytes": bot.stats()["bytes"],
+            "calls": sheets["calls"],
+            "problems": check_requests(flow_name, sheets["log"]),
+        })
+    return results
+
+def print_table(results):
+    columns = ["people", "flow", "wall_ms", "sheets_calls", "reads", "writes", "retries", "bytes_down", "bytes_up", "telegram_messages", "telegram_bytes"]
+    widths = {column: max(len(column), *(len(str(result[column])) for result in results)) for column in columns}
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    for result in results:
+        print("  ".join(str(result[column]).ljust(widths[column]) for column in columns))
+
+async def main(args):
+    Status.start_scheduler() # Checks report the next run time
+    try:
+        results = []
+        for people in args.people:
+            results.extend(await run_size(people, args))
+    finally:
+        Status.scheduler.shutdown(wait=False)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Status.py flows against in-memory Google Sheets and Telegram.")
+    parser.add_argument("--people", type=int, nargs="+", default=[40, 120, 400], help="AE platoon sizes to test")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every Sheets request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random Sheets latency, up to this many seconds")
+    parser.add_argument("--quota-every", type=int, default=0, help="Every Nth Sheets request fails with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds of injected 429s")
+    parser.add_argument("--telegram-latency", type=float, default=0.0, help="Seconds added to every Telegram send")
+    parser.add_argument("--flood-every", type=int, default=0, help="Every Nth Telegram send fails with RetryAfter")
+    parser.add_argument("--warm", action="store_true", help="Keep snapshot caches between flows")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Show the bot's own logging")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"Clock: {BENCHMARK_NOW.strftime('%a %d/%m/%y %H:%M')} SGT, nightly checks look at {check_day().strftime('%a %d/%m/%y')}")
+        print_table(results)
+    problems = [f"{result['people']} people, {result['flow']}: {problem}" for result in results for problem in result["problems"]]
+    if problems:
+        print("\n❌ Request budget exceeded:\n" + "\n".join(problems), file=sys.stderr)
+        sys.exit(1)
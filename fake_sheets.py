@@ -0,0 +1,309 @@
+# In-memory stand-in for the parts of gspread and the Telegram bot that Status.py uses
+# Used by benchmark.py, no Google or Telegram account needed
+from types import SimpleNamespace
+import itertools
+import threading
+import requests
+import gspread
+import random
+import json
+import time
+import re
+
+RANGE_PATTERN = re.compile(r"^(?:'((?:[^']|'')*)'|([^!]+))(?:!(.+))?$") # "'Sheet'!A1:B2", "Sheet!A1" or "'Sheet'"
+
+class FakeBackend:
+    # Shared by every fake spreadsheet, counts calls and bytes and injects latency and quota errors
+    def __init__(self, latency=0.0, jitter=0.0, quota_every=0, retry_after=1, seed=0):
+        self.latency = latency # Seconds added to every request
+        self.jitter = jitter # Extra random seconds, up to this much
+        self.quota_every = quota_every # Every Nth request fails with 429, 0 to never fail
+        self.retry_after = retry_after # Retry-After header of injected 429s, None to leave it out
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.spreadsheets = {} # Url -> spreadsheet
+        self.ids = itertools.count(1)
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.lock:
+            self.calls = {} # Method -> count
+            self.log = [] # (method, spreadsheet title, worksheet titles, failed) of every request
+            self.bytes_down = 0
+            self.bytes_up = 0
+            self.errors = 0
+            self.requests = 0
+
+    def request(self, method, payload=None, spreadsheet=None, sheets=()):
+        # Called at the start of every fake API request (In the sheets thread pool, so sleeping is fine)
+        with self.lock:
+            self.requests += 1
+            self.calls[method] = self.calls.get(method, 0) + 1
+            if payload is not None:
+                self.bytes_up += len(json.dumps(payload))
+            fail = self.quota_every and self.requests % self.quota_every == 0
+            self.log.append((method, spreadsheet, tuple(sheets), bool(fail)))
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        if fail:
+            with self.lock:
+                self.errors += 1
+            raise quota_error(self.retry_after)
+
+    def download(self, values):
+        with self.lock:
+            self.bytes_down += len(json.dumps(values))
+        return values
+
+    def stats(self):
+        with self.lock:
+            return {"calls": dict(self.calls), "requests": self.requests, "errors": self.errors, "bytes_down": self.bytes_down, "bytes_up": self.bytes_up, "log": list(self.log)}
+
+    def add_spreadsheet(self, url, title, worksheets):
+        # worksheets: {title: all values}
+        spreadsheet = FakeSpreadsheet(self, title)
+        for sheet_name, values in worksheets.items():
+            spreadsheet.add_worksheet(sheet_name, values)
+        self.spreadsheets[url] = spreadsheet
+        return spreadsheet
+
+    def client(self):
+        return FakeClient(self)
+
+def quota_error(retry_after=None):
+    # Same shape as a real 429 from the Sheets API
+    response = requests.Response()
+    response.status_code = 429
+    response._content = json.dumps({"error": {"code": 429, "message": "Quota exceeded for quota metric 'Read requests'", "status": "RESOURCE_EXHAUSTED"}}).encode()
+    if retry_after is not None:
+        response.headers["Retry-After"] = str(retry_after)
+    return gspread.exceptions.APIError(response)
+
+def split_range(a1_range):
+    # Returns (sheet name or None, cell range or None)
+    match = RANGE_PATTERN.match(a1_range)
+    if not match or "!" not in a1_range and not a1_range.startswith("'"):
+        return None, a1_range
+    sheet_name = match.group(1).replace("''", "'") if match.group(1) is not None else match.group(2)
+    return sheet_name, match.group(3)
+
+class FakeClient:
+    def __init__(self, backend):
+        self.backend = backend
+
+    def open_by_url(self, url):
+        self.backend.request("open_by_url")
+        if url not in self.backend.spreadsheets:
+            raise gspread.exceptions.SpreadsheetNotFound(url)
+        return self.backend.spreadsheets[url]
+
+class FakeSpreadsheet:
+    def __init__(self, backend, title):
+        self.backend = backend
+        self.title = title
+        self.id = f"fake-spreadsheet-{next(backend.ids)}"
+        self.tabs = {} # Title -> worksheet, in tab order
+
+    def add_worksheet(self, title, values, rows=None, cols=None):
+        worksheet = FakeWorksheet(self, title, values)
+        self.tabs[title] = worksheet
+        return worksheet
+
+    def worksheets(self):
+        self.backend.request("worksheets", None, self.title)
+        return list(self.tabs.values())
+
+    def worksheet(self, title):
+        self.backend.request("worksheet", None, self.title, [title])
+        if title not in self.tabs:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return self.tabs[title]
+
+    def values_batch_get(self, ranges, params=None):
+        self.backend.request("values_batch_get", ranges, self.title, [split_range(a1_range)[0] for a1_range in ranges])
+        value_ranges = []
+        for a1_range in ranges:
+            sheet_name, _ = split_range(a1_range)
+            if sheet_name not in self.tabs:
+                raise gspread.exceptions.APIError(bad_request(f"Unable to parse range: {a1_range}"))
+            # Like the API, trailing empty cells and rows are left out
+            values = [trim(row) for row in self.tabs[sheet_name].values]
+            while values and not values[-1]:
+                values.pop()
+            value_ranges.append({"range": a1_range, "majorDimension": "ROWS", "values": self.backend.download(values)})
+        return {"spreadsheetId": self.id, "valueRanges": value_ranges}
+
+    def values_batch_update(self, body):
+        self.backend.request("values_batch_update", body, self.title, dict.fromkeys(split_range(data["range"])[0] for data in body.get("data", [])))
+        responses = []
+        for data in body.get("data", []):
+            sheet_name, cell_range = split_range(data["range"])
+            if sheet_name not in self.tabs:
+                raise gspread.exceptions.APIError(bad_request(f"Unable to parse range: {data['range']}"))
+            updated = self.tabs[sheet_name].write(cell_range, data["values"])
+            responses.append({"updatedRange": data["range"], "updatedCells": updated})
+        return {"spreadsheetId": self.id, "totalUpdatedCells": sum(r["updatedCells"] for r in responses), "responses": responses}
+
+def bad_request(message):
+    response = requests.Response()
+    response.status_code = 400
+    response._content = json.dumps({"error": {"code": 400, "message": message, "status": "INVALID_ARGUMENT"}}).encode()
+    return response
+
+def trim(row):
+    row = list(row)
+    while row and row[-1] == "":
+        row.pop()
+    return row
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet, title, values):
+        self.spreadsheet = spreadsheet
+        self.backend = spreadsheet.backend
+        self.title = title
+        self.id = next(self.backend.ids)
+        self.values = [list(row) for row in values]
+        self.extra_rows = 0 # Empty rows at the bottom of the grid
+
+    @property
+    def row_count(self):
+        return len(self.values) + self.extra_rows
+
+    def write(self, cell_range, values):
+        # Writes a block starting at the top left cell of the range, returns cells written
+        start_row, start_col = gspread.utils.a1_to_rowcol(cell_range.split(":")[0])
+        updated = 0
+        for r, row_values in enumerate(values):
+            row_index = start_row - 1 + r
+            while len(self.values) <= row_index:
+                self.values.append([])
+                self.extra_rows = max(self.extra_rows - 1, 0)
+            row = self.values[row_index]
+            for c, value in enumerate(row_values):
+                col_index = start_col - 1 + c
+                if len(row) <= col_index:
+                    row.extend([""] * (col_index + 1 - len(row)))
+                row[col_index] = "" if value is None else str(value)
+                updated += 1
+        return updated
+
+    def grid(self):
+        values = [list(row) for row in self.values]
+        return gspread.utils.fill_gaps(values) if values else []
+
+    def get_all_values(self):
+        self.backend.request("get_all_values", None, self.spreadsheet.title, [self.title])
+        return self.backend.download(self.grid())
+
+    def get_all_records(self, head=1):
+        self.backend.request("get_all_records", None, self.spreadsheet.title, [self.title])
+        values = self.grid()
+        if len(values) < head:
+            return []
+        keys = values[head - 1]
+        return self.backend.download([dict(zip(keys, row)) for row in values[head:]])
+
+    def batch_update(self, data, **kwargs):
+        self.backend.request("batch_update", data, self.spreadsheet.title, [self.title])
+        updated = sum(self.write(update["range"], update["values"]) for update in data)
+        return {"totalUpdatedCells": updated}
+
+    def update(self, range_name=None, values=None, **kwargs):
+        self.backend.request("update", values, self.spreadsheet.title, [self.title])
+        return {"updatedCells": self.write(range_name, values)}
+
+    def insert_rows(self, values, row=1, **kwargs):
+        self.backend.request("insert_rows", values, self.spreadsheet.title, [self.title])
+        self.values[row - 1:row - 1] = [list(value) for value in values]
+
+    def delete_rows(self, start_index, end_index=None):
+        self.backend.request("delete_rows", None, self.spreadsheet.title, [self.title])
+        del self.values[start_index - 1:(end_index or start_index)]
+
+    def resize(self, rows=None, cols=None):
+        self.backend.request("resize", None, self.spreadsheet.title, [self.title])
+        if rows is not None:
+            del self.values[rows:]
+            self.extra_rows = rows - len(self.values)
+
+class FakeBot:
+    # Replaces ptb.bot, counts messages and can answer with flood control errors
+    def __init__(self, latency=0.0, flood_every=0, retry_after=1):
+        self.latency = latency
+        self.flood_every = flood_every # Every Nth send fails with RetryAfter, 0 to never fail
+        self.retry_after = retry_after
+        self.sent = [] # (chat id, text)
+        self.attempts = 0
+        self.floods = 0
+
+    async def send_message(self, chat_id, text, **kwargs):
+        import asyncio
+        from telegram.error import RetryAfter
+        self.attempts += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.flood_every and self.attempts % self.flood_every == 0:
+            self.floods += 1
+            raise RetryAfter(self.retry_after)
+        self.sent.append((chat_id, text))
+        return FakeMessage(self, chat_id, text)
+
+    def stats(self):
+        return {"messages": len(self.sent), "attempts": self.attempts, "floods": self.floods, "bytes": sum(len(text.encode()) for _, text in self.sent)}
+
+class FakeMessage(SimpleNamespace):
+    # Enough of telegram.Message for the handlers (reply_text, edit_text, edit_message_reply_markup)
+    def __init__(self, bot, chat_id, text):
+        super().__init__(bot=bot, chat_id=chat_id, text=text, chat=SimpleNamespace(id=chat_id))
+
+    async def reply_text(self, text, **kwargs):
+        return await self.bot.send_message(self.chat_id, text, **kwargs)
+
+    async def edit_text(self, text, **kwargs):
+        self.text = text
+        return self
+
+    async def edit_message_reply_markup(self, reply_markup=None, **kwargs):
+        return self
+
+# Roster builders (Same layout as the real sheets: title row, header row, people from the third row)
+FORMAL_HEADERS = ["S/N", "Rank", "Name", "Platoon", "Status", "Date", "Remarks", "Location"]
+RANKS = ["PTE", "LCP", "CPL", "3SG", "2SG"]
+FIRST_NAMES = ["Tan", "Lim", "Lee", "Ng", "Ong", "Wong", "Goh", "Chua", "Chan", "Koh", "Teo", "Ang", "Yeo", "Tay", "Ho", "Low", "Toh", "Sim", "Chong", "Chia",
+               "Lau", "Quek", "Heng", "Soh", "Foo", "Seah", "Kwek", "Loh", "Pang", "Yap", "Chew", "Neo", "Phua", "Kang", "Lai", "Tham", "Wee", "Poh", "Mok", "Leong"]
+LAST_NAMES = ["Wei Ming", "Jun Jie", "Zhi Hao", "Kai Wen", "Jia Hui", "Yi Xuan", "Ming Hui", "Jun Wei", "Xin Yi", "Hao Ran", "Rui En", "Shu Ting", "Wen Jie", "Jia Le", "Zi Xuan"]
+
+def make_names(count, seed=0):
+    names, rng = [], random.Random(seed)
+    pairs = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+    rng.shuffle(pairs)
+    for i in range(count):
+        name = pairs[i % len(pairs)]
+        names.append(name if i < len(pairs) else f"{name} {i // len(pairs)}") # Still unique past the 600 pairs, but "Tan Wei Ming" then matches "Tan Wei Ming 1" too
+    return names
+
+def formal_sheet(names, other_rows, night=False, statuses=None):
+    # statuses: {name: (status, date, remarks, location)}, everyone else is present
+    statuses = statuses or {}
+    default = "P - STAY OUT" if night else "PRESENT"
+    values = [["Parade State"], FORMAL_HEADERS]
+    for i in range(other_rows): # Other platoons above the AE block
+        values.append([str(i + 1), "PTE", f"Other {i + 1}", "HQ", default, "", "", ""])
+    for i, name in enumerate(names):
+        status, date_text, remarks, location = statuses.get(name, (default, "", "", ""))
+        values.append([str(i + 1), RANKS[i % len(RANKS)], name, "AE", status, date_text, remarks, location])
+    for i in range(other_rows): # And below it
+        values.append([str(i + 1), "PTE", f"Support {i + 1}", "SP", default, "", "", ""])
+    return values
+
+def informal_sheet(names, other_rows, filled_days=0):
+    # Two batches, the AE batch starts at the second "S/N" row, days 1 to filled_days already have a status
+    headers = ["S/N", "Name"] + [str(day) for day in range(1, 32)]
+    values = [["Attendance"], headers]
+    for i in range(other_rows):
+        values.append([str(i + 1), f"Other {i + 1}"] + ["1"] * filled_days + [""] * (31 - filled_days))
+    values.append(headers)
+    for i, name in enumerate(names):
+        values.append([str(i + 1), name] + ["1"] * filled_days + [""] * (31 - filled_days))
+    return values